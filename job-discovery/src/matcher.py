@@ -18,10 +18,15 @@ import json
 import logging
 import re
 from dataclasses import asdict
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import NamedTuple
+from typing import NamedTuple, Protocol
+
+try:
+    import orjson
+except ImportError:  # optional speedup — fall back to stdlib json
+    orjson = None
 
 from src.config import PipelineConfig
 from src.models import JobPosting
@@ -50,7 +55,11 @@ class FilterResult(NamedTuple):
 # ── Date Parsing ────────────────────────────────────────────────────────────
 
 
-def parse_posted_date(date_str: str | None) -> datetime | None:
+def parse_posted_date(
+    date_str: str | None,
+    *,
+    now: datetime | None = None,
+) -> datetime | None:
     """Parse a posted date string into a datetime.
 
     Handles various formats:
@@ -58,6 +67,9 @@ def parse_posted_date(date_str: str | None) -> datetime | None:
     - Relative: "30+ days ago", "2 days ago", "today", "yesterday"
     - Month day: "Feb 1, 2026", "February 1, 2026"
 
+    Relative dates are resolved against ``now`` (defaults to the current
+    UTC time); pass it in when parsing many dates in a row.
+
     Returns None if parsing fails (job should be included when date unknown).
     """
     if not date_str:
@@ -65,29 +77,32 @@ def parse_posted_date(date_str: str | None) -> datetime | None:
 
     date_str = date_str.strip().lower()
 
+    if now is None:
+        now = datetime.now(timezone.utc)
+
     # Handle relative dates
     if "today" in date_str:
-        return datetime.now(timezone.utc)
+        return now
     if "yesterday" in date_str:
-        return datetime.now(timezone.utc) - timedelta(days=1)
+        return now - timedelta(days=1)
 
     # "X days ago" pattern
     days_ago_match = re.search(r"(\d+)\+?\s*days?\s*ago", date_str)
     if days_ago_match:
         days = int(days_ago_match.group(1))
-        return datetime.now(timezone.utc) - timedelta(days=days)
+        return now - timedelta(days=days)
 
     # "X weeks ago" pattern
     weeks_ago_match = re.search(r"(\d+)\+?\s*weeks?\s*ago", date_str)
     if weeks_ago_match:
         weeks = int(weeks_ago_match.group(1))
-        return datetime.now(timezone.utc) - timedelta(weeks=weeks)
+        return now - timedelta(weeks=weeks)
 
     # "X months ago" pattern (approximate as 30 days)
     months_ago_match = re.search(r"(\d+)\+?\s*months?\s*ago", date_str)
     if months_ago_match:
         months = int(months_ago_match.group(1))
-        return datetime.now(timezone.utc) - timedelta(days=months * 30)
+        return now - timedelta(days=months * 30)
 
     # Try ISO format variations
     for fmt in [
@@ -137,6 +152,42 @@ def title_matches_exclude(title: str, exclude_keywords: list[str]) -> bool:
     return any(kw.lower() in title_lower for kw in exclude_keywords)
 
 
+class _TitleClassifier:
+    """Classify a title against include/exclude keywords in a single scan.
+
+    Both keyword lists are compiled into one regex of the form
+    ``(?=(exclude...)|(include...))``. The zero-width lookahead is tried at
+    every position, so overlapping keywords are all seen, and exclude
+    alternatives are tried first so they win when both start at the same
+    position. The scan stops at the first exclude hit.
+    """
+
+    EXCLUDE = "exclude"
+    INCLUDE = "include"
+    NONE = "none"
+
+    def __init__(self, include_keywords: list[str], exclude_keywords: list[str]):
+        # No include list means include everything
+        self._include_all = not include_keywords
+        # An empty list never matches ("(?!)"), but an empty keyword
+        # matches every title, as it does in title_matches_include/exclude
+        exclude = "|".join(re.escape(kw.lower()) for kw in exclude_keywords)
+        include = "|".join(re.escape(kw.lower()) for kw in include_keywords)
+        self._pattern = re.compile(
+            f"(?=({exclude if exclude_keywords else '(?!)'})"
+            f"|({include if include_keywords else '(?!)'}))"
+        )
+
+    def classify(self, title_lower: str) -> str:
+        """Return EXCLUDE, INCLUDE or NONE for an already-lowercased title."""
+        included = self._include_all
+        for m in self._pattern.finditer(title_lower):
+            if m.group(1) is not None:
+                return self.EXCLUDE
+            included = True
+        return self.INCLUDE if included else self.NONE
+
+
 # ── Cheap Filters ───────────────────────────────────────────────────────────
 
 
@@ -172,29 +223,32 @@ def apply_duplicate_filter(
 def apply_age_filter(
     jobs: list[JobPosting],
     max_age_days: int,
+    *,
+    now: datetime | None = None,
 ) -> tuple[list[JobPosting], list[FilterResult]]:
     """Filter out jobs older than max_age_days.
 
-    Jobs without a parseable date are included (fail open).
+    Jobs without a parseable date are included (fail open). ISO dates are
+    compared as precomputed day ordinals (JobPosting.posted_ordinal); only
+    relative/free-form dates go through parse_posted_date.
 
     Args:
         jobs: List of jobs to filter
         max_age_days: Maximum age in days
+        now: Reference time (defaults to the current UTC time)
 
     Returns:
         (passed_jobs, rejected_results)
     """
     passed = []
     rejected = []
-    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=max_age_days)
+    cutoff_ord = (cutoff.date() - date(1970, 1, 1)).days
 
     for job in jobs:
-        posted_date = parse_posted_date(job.posted_date)
-
-        if posted_date is None:
-            # No date available — include the job (fail open)
-            passed.append(job)
-        elif posted_date >= cutoff:
+        if _is_recent(job, now, cutoff, cutoff_ord):
             passed.append(job)
         else:
             rejected.append(FilterResult(job, False, RejectionReason.AGE))
@@ -203,6 +257,23 @@ def apply_age_filter(
     return passed, rejected
 
 
+def _is_recent(
+    job: JobPosting,
+    now: datetime,
+    cutoff: datetime,
+    cutoff_ord: int,
+) -> bool:
+    """True if the job was posted on or after the cutoff (or has no usable date)."""
+    if job.posted_ordinal is not None:
+        return job.posted_ordinal >= cutoff_ord
+
+    posted_date = parse_posted_date(job.posted_date, now=now)
+    if posted_date is None:
+        # No date available — include the job (fail open)
+        return True
+    return posted_date >= cutoff
+
+
 def apply_title_filter(
     jobs: list[JobPosting],
     include_keywords: list[str],
@@ -227,14 +298,13 @@ def apply_title_filter(
     passed = []
     rejected = []
 
+    classifier = _TitleClassifier(include_keywords, exclude_keywords)
+
     for job in jobs:
-        # Check exclusion first (it overrides)
-        if title_matches_exclude(job.title, exclude_keywords):
+        verdict = classifier.classify(job.title_lower)
+        if verdict == _TitleClassifier.EXCLUDE:
             rejected.append(FilterResult(job, False, RejectionReason.TITLE_EXCLUDE))
-            continue
-
-        # Check inclusion
-        if title_matches_include(job.title, include_keywords):
+        elif verdict == _TitleClassifier.INCLUDE:
             passed.append(job)
         else:
             rejected.append(FilterResult(job, False, RejectionReason.TITLE_NO_MATCH))
@@ -248,10 +318,11 @@ def cheap_filters(
     seen_urls: set[str],
     config: PipelineConfig,
 ) -> tuple[list[JobPosting], list[FilterResult]]:
-    """Apply all cheap filters in sequence.
+    """Apply all cheap filters in a single pass over the jobs.
 
-    Filter order (each operates on output of previous):
-    1. Duplicate check (cheapest — dict lookup)
+    Each job is checked in this order and rejected by the first filter
+    it fails (same precedence as running the apply_* filters in sequence):
+    1. Duplicate check (cheapest — set lookup)
     2. Age filter
     3. Title keyword filter
 
@@ -263,36 +334,80 @@ def cheap_filters(
     Returns:
         (passed_jobs, all_rejection_results)
     """
+    criteria = config.match_criteria
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=criteria.max_age_days)
+    cutoff_ord = (cutoff.date() - date(1970, 1, 1)).days
+    classifier = _TitleClassifier(criteria.title_include, criteria.title_exclude)
+
+    passed: list[JobPosting] = []
     all_rejected: list[FilterResult] = []
+    n_duplicate = n_age = n_title = 0
 
-    # 1. Duplicate filter
-    jobs, rejected = apply_duplicate_filter(jobs, seen_urls)
-    all_rejected.extend(rejected)
+    for job in jobs:
+        # 1. Duplicate filter
+        if normalize_url(job.url) in seen_urls:
+            all_rejected.append(FilterResult(job, False, RejectionReason.DUPLICATE))
+            n_duplicate += 1
+            continue
 
-    # 2. Age filter
-    jobs, rejected = apply_age_filter(jobs, config.match_criteria.max_age_days)
-    all_rejected.extend(rejected)
+        # 2. Age filter
+        if not _is_recent(job, now, cutoff, cutoff_ord):
+            all_rejected.append(FilterResult(job, False, RejectionReason.AGE))
+            n_age += 1
+            continue
 
-    # 3. Title filter
-    jobs, rejected = apply_title_filter(
-        jobs,
-        config.match_criteria.title_include,
-        config.match_criteria.title_exclude,
-    )
-    all_rejected.extend(rejected)
+        # 3. Title filter
+        verdict = classifier.classify(job.title_lower)
+        if verdict == _TitleClassifier.EXCLUDE:
+            all_rejected.append(FilterResult(job, False, RejectionReason.TITLE_EXCLUDE))
+            n_title += 1
+        elif verdict == _TitleClassifier.NONE:
+            all_rejected.append(FilterResult(job, False, RejectionReason.TITLE_NO_MATCH))
+            n_title += 1
+        else:
+            passed.append(job)
 
+    # Same per-stage counts the apply_* filters log when run in sequence
+    remaining = len(jobs) - n_duplicate
+    logger.debug("Duplicate filter: %d passed, %d rejected", remaining, n_duplicate)
+    remaining -= n_age
+    logger.debug("Age filter: %d passed, %d rejected", remaining, n_age)
+    logger.debug("Title filter: %d passed, %d rejected", len(passed), n_title)
     logger.info(
         "Cheap filters complete: %d passed, %d rejected",
-        len(jobs),
+        len(passed),
         len(all_rejected),
     )
 
-    return jobs, all_rejected
+    return passed, all_rejected
 
 
 # ── Candidates File ─────────────────────────────────────────────────────────
 
 
+def _candidate_record(job: JobPosting) -> dict:
+    """The candidates.json record for a single job."""
+    return {
+        "title": job.title,
+        "company": job.company,
+        "url": job.url,
+        "location": job.location,
+        "department": job.department,
+        "date_posted": job.posted_date,
+        "source": job.source,
+        "description": job.description or "",
+    }
+
+
+def _serialize_candidate(job: JobPosting) -> bytes:
+    """Serialize a job's candidate record to JSON bytes."""
+    record = _candidate_record(job)
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
 def write_candidates(
     jobs: list[JobPosting],
     data_dir: str | Path = "data",
@@ -302,6 +417,10 @@ def write_candidates(
     This file is overwritten on each run — it's a working file, not a log.
     The evaluation skill reads this file and evaluates each job.
 
+    Each job is serialized independently (one record per line) and the
+    bytes are cached via JobPosting.cached_json, so re-writing the same
+    jobs skips serialization.
+
     Args:
         jobs: Jobs that passed cheap filtering
         data_dir: Directory to write to
@@ -314,24 +433,14 @@ def write_candidates(
 
     candidates_path = data_path / "candidates.json"
 
-    # Convert jobs to dicts for JSON serialization
-    candidates = []
-    for job in jobs:
-        candidates.append({
-            "title": job.title,
-            "company": job.company,
-            "url": job.url,
-            "location": job.location,
-            "department": job.department,
-            "date_posted": job.posted_date,
-            "source": job.source,
-            "description": job.description or "",
-        })
-
-    with open(candidates_path, "w") as f:
-        json.dump(candidates, f, indent=2, ensure_ascii=False)
-
-    logger.info("Wrote %d candidates to %s", len(candidates), candidates_path)
+    parts = [job.cached_json(_serialize_candidate) for job in jobs]
+    with open(candidates_path, "wb") as f:
+        if parts:
+            f.write(b"[\n" + b",\n".join(parts) + b"\n]\n")
+        else:
+            f.write(b"[]\n")
+
+    logger.info("Wrote %d candidates to %s", len(parts), candidates_path)
     return candidates_path
 
 
@@ -356,6 +465,48 @@ def load_candidates(data_dir: str | Path = "data") -> list[dict]:
         return json.load(f)
 
 
+class CandidateSink(Protocol):
+    """Where run_matching puts the jobs that pass cheap filtering."""
+
+    def write(self, jobs: list[JobPosting]) -> Path:
+        ...
+
+    def load(self) -> list[dict]:
+        ...
+
+
+class FileSink:
+    """Writes candidates to <data_dir>/candidates.json (the production sink)."""
+
+    def __init__(self, data_dir: str | Path = "data"):
+        self.data_dir = Path(data_dir)
+
+    def write(self, jobs: list[JobPosting]) -> Path:
+        return write_candidates(jobs, self.data_dir)
+
+    def load(self) -> list[dict]:
+        return load_candidates(self.data_dir)
+
+
+class InMemorySink:
+    """Keeps candidate records in memory — no serialization or disk I/O.
+
+    Useful in tests. `write` returns a nominal candidates.json path that
+    is never created.
+    """
+
+    def __init__(self):
+        self.candidates: list[dict] = []
+        self.path = Path("candidates.json")
+
+    def write(self, jobs: list[JobPosting]) -> Path:
+        self.candidates = [_candidate_record(job) for job in jobs]
+        return self.path
+
+    def load(self) -> list[dict]:
+        return list(self.candidates)
+
+
 # ── Main Entry Point ────────────────────────────────────────────────────────
 
 
@@ -363,6 +514,7 @@ def run_matching(
     jobs: list[JobPosting],
     seen_urls: set[str],
     config: PipelineConfig,
+    sink: CandidateSink | None = None,
 ) -> tuple[Path, list[FilterResult]]:
     """Run the full matching module: cheap filters + write candidates file.
 
@@ -377,6 +529,7 @@ def run_matching(
         jobs: Raw jobs from discovery
         seen_urls: Set of normalized URLs already processed
         config: Pipeline configuration
+        sink: Where to write candidates (default: FileSink(config.data_dir))
 
     Returns:
         (candidates_file_path, rejection_log)
@@ -385,7 +538,9 @@ def run_matching(
     passed_jobs, rejection_log = cheap_filters(jobs, seen_urls, config)
 
     # Write candidates file
-    candidates_path = write_candidates(passed_jobs, config.data_dir)
+    if sink is None:
+        sink = FileSink(config.data_dir)
+    candidates_path = sink.write(passed_jobs)
 
     return candidates_path, rejection_log
 
@@ -3,12 +3,35 @@
 from __future__ import annotations
 
 import hashlib
+import sys
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Callable, Optional
 
+# Ordinal of 1970-01-01, so posted_ordinal is "days since the Unix epoch"
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-@dataclass
+# Slots computed in __post_init__ — not part of the serialized posting
+_DERIVED_FIELDS = ("title_lower", "posted_ordinal", "_json_cache", "_fp")
+
+
+def iso_date_ordinal(date_str: str | None) -> int | None:
+    """Days since the Unix epoch for an ISO 8601 date string.
+
+    Only the leading YYYY-MM-DD is looked at, so full timestamps like
+    "2026-02-01T10:30:00Z" work too. Returns None for anything else
+    (relative dates, "Feb 1, 2026", etc.) — callers fall back to the
+    slower matcher.parse_posted_date for those.
+    """
+    if not date_str:
+        return None
+    try:
+        return date.fromisoformat(date_str.strip()[:10]).toordinal() - _EPOCH_ORDINAL
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class JobPosting:
     """Represents a single discovered job posting.
 
@@ -28,19 +51,52 @@ class JobPosting:
     posted_date: Optional[str] = None
     discovered_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
+    # Derived once at construction for the cheap filters
+    title_lower: str = field(default="", init=False, repr=False, compare=False)
+    posted_ordinal: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    # Serialized candidate record, filled lazily through cached_json()
+    _json_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _fp: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Every job from a source repeats the same source/company strings;
+        # intern them so large runs share one copy of each. Scraped
+        # records can carry None for any of these (e.g. a source config
+        # with an empty `company:` key); leave those for the filters.
+        if isinstance(self.source, str):
+            self.source = sys.intern(self.source)
+        if isinstance(self.company, str):
+            self.company = sys.intern(self.company)
+        self.title_lower = (self.title or "").lower()
+        self.posted_ordinal = iso_date_ordinal(self.posted_date)
+        normalized = (self.url or "").strip().rstrip("/").lower()
+        self._fp = hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
     @property
     def fingerprint(self) -> str:
         """A stable hash for deduplication.
 
         Uses the canonical URL as the primary key. If two sources point
-        to the same URL, they represent the same job.
+        to the same URL, they represent the same job. Computed once at
+        construction.
+        """
+        return self._fp
+
+    def cached_json(self, serialize: Callable[["JobPosting"], bytes]) -> bytes:
+        """Return this job's serialized record, building it once.
+
+        The first call stores ``serialize(self)`` on the job; later calls
+        return the same bytes without calling ``serialize`` again.
         """
-        normalized = self.url.strip().rstrip("/").lower()
-        return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        if self._json_cache is None:
+            self._json_cache = serialize(self)
+        return self._json_cache
 
     def to_dict(self) -> dict:
         """Serialize to a plain dictionary."""
         d = asdict(self)
+        for name in _DERIVED_FIELDS:
+            del d[name]
         d["fingerprint"] = self.fingerprint
         return d
 
@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.config import PipelineConfig
+
+
+@pytest.fixture(scope="session")
+def default_config() -> PipelineConfig:
+    """A default PipelineConfig shared across tests (scrapers only read it)."""
+    return PipelineConfig()
@@ -0,0 +1,362 @@
+"""Tests for the discovery log viewer's data shaping.
+
+Tests cover:
+- JSONL loading (bulk parse, malformed-line fallback, parallel chunks)
+- URL normalization used to group log entries
+- Deduplication by URL (seen_count, first-seen aggregation)
+- The page payload written by write_html (columns, derived keys, escaping)
+- The --no-dedup flag
+"""
+
+import base64
+import gzip
+import json
+import mmap
+import re
+import sys
+
+import pytest
+
+from visualizers import discovery_viewer
+from visualizers.discovery_viewer import (
+    _PAYLOAD_COLS,
+    _add_first_seen,
+    _dedup_by_url,
+    _load_parallel,
+    _normalize_url,
+    load_jsonl,
+    write_html,
+)
+
+
+def _entry(url, scraped_at, **fields):
+    return {"title": "Scientist", "url": url, "scraped_at": scraped_at, **fields}
+
+
+# ── Loading Tests ───────────────────────────────────────────────────────────
+
+
+def _records(n):
+    return [{"url": f"https://example.com/jobs/{i}", "title": f"Job {i}"} for i in range(n)]
+
+
+def _jsonl(records, newline="\n"):
+    return "".join(json.dumps(r) + newline for r in records)
+
+
+class TestLoadJsonl:
+    """Tests for load_jsonl."""
+
+    def test_bulk_parse(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_text(_jsonl(_records(3)))
+        assert load_jsonl(path) == _records(3)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_text("")
+        assert load_jsonl(path) == []
+
+    def test_missing_final_newline(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_text(_jsonl(_records(2)).rstrip("\n"))
+        assert load_jsonl(path) == _records(2)
+
+    def test_blank_lines_skipped(self, tmp_path):
+        lines = _jsonl(_records(2)).splitlines()
+        path = tmp_path / "log.jsonl"
+        path.write_text("\n" + lines[0] + "\n\n  \n" + lines[1] + "\n\n")
+        assert load_jsonl(path) == _records(2)
+
+    def test_malformed_line_skipped(self, tmp_path, capsys):
+        lines = _jsonl(_records(2)).splitlines()
+        path = tmp_path / "log.jsonl"
+        path.write_text(lines[0] + '\n{"url": "broken\n' + lines[1] + "\n")
+        assert load_jsonl(path) == _records(2)
+        assert "skipped malformed line 2" in capsys.readouterr().err
+
+    def test_crlf_line_endings(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(_jsonl(_records(3), newline="\r\n").encode())
+        assert load_jsonl(path) == _records(3)
+
+
+class TestLoadParallel:
+    """The process-pool path must give the same entries as the serial one."""
+
+    @pytest.fixture
+    def force_parallel(self, monkeypatch):
+        monkeypatch.setattr(discovery_viewer, "_PARALLEL_MIN_BYTES", 1)
+        monkeypatch.setattr(discovery_viewer.os, "cpu_count", lambda: 3)
+
+    def test_matches_serial(self, tmp_path, force_parallel):
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(_jsonl(_records(50), newline="\r\n").encode())
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            assert _load_parallel(path, mm, 3) == _records(50)
+        assert load_jsonl(path) == _records(50)
+
+    def test_more_workers_than_lines(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_text(_jsonl(_records(2)))
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            assert _load_parallel(path, mm, 8) == _records(2)
+
+    def test_bad_line_in_chunk_raises(self, tmp_path):
+        lines = _jsonl(_records(40)).splitlines(keepends=True)
+        lines.insert(25, "not json\n")
+        path = tmp_path / "log.jsonl"
+        path.write_text("".join(lines))
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with pytest.raises(ValueError):
+                _load_parallel(path, mm, 3)
+
+    def test_bad_line_falls_back_to_serial(self, tmp_path, force_parallel, capsys):
+        lines = _jsonl(_records(40)).splitlines(keepends=True)
+        lines.insert(25, "not json\n")
+        lines.insert(10, "\n")
+        path = tmp_path / "log.jsonl"
+        path.write_text("".join(lines))
+        assert load_jsonl(path) == _records(40)
+        assert "skipped malformed line 27" in capsys.readouterr().err
+
+
+# ── URL Normalization Tests ─────────────────────────────────────────────────
+
+
+class TestNormalizeUrl:
+    """Tests for _normalize_url."""
+
+    def test_strips_scheme_www_and_trailing_slash(self):
+        assert _normalize_url("https://www.example.com/jobs/123/") == "example.com/jobs/123"
+        assert _normalize_url("http://example.com/jobs/123//") == "example.com/jobs/123"
+
+    def test_lowercases(self):
+        assert _normalize_url("https://Example.com/Jobs/ABC") == "example.com/jobs/abc"
+
+    def test_empty_url(self):
+        assert _normalize_url(None) == ""
+        assert _normalize_url("") == ""
+
+    def test_drops_tracking_params(self):
+        url = "https://example.com/jobs/1?utm_source=linkedin&gh_src=abc"
+        assert _normalize_url(url) == "example.com/jobs/1"
+
+    def test_trailing_slash_before_query(self):
+        assert _normalize_url("https://example.com/jobs/?id=1") == "example.com/jobs?id=1"
+
+    def test_keeps_identifying_params(self):
+        url = "https://example.com/apply?utm_medium=email&jobId=42&ref=x"
+        assert _normalize_url(url) == "example.com/apply?jobid=42"
+
+    def test_keeps_fragment(self):
+        """Hash-routed boards identify the job in the fragment."""
+        assert _normalize_url("https://example.com/#/jobs/1") != _normalize_url(
+            "https://example.com/#/jobs/2"
+        )
+
+    def test_fragment_not_parsed_as_query(self):
+        url = "https://example.com/careers/?utm_source=x#/Jobs/7"
+        assert _normalize_url(url) == "example.com/careers#/jobs/7"
+
+    def test_trailing_slash_before_fragment(self):
+        assert _normalize_url("https://example.com/jobs/1/#apply") == "example.com/jobs/1#apply"
+
+    def test_empty_fragment_dropped(self):
+        assert _normalize_url("https://example.com/jobs/1#") == "example.com/jobs/1"
+
+
+# ── Deduplication Tests ─────────────────────────────────────────────────────
+
+
+class TestDedupByUrl:
+    """Tests for _dedup_by_url and first_seen aggregation."""
+
+    def test_counts_sightings(self):
+        entries = [
+            _entry("https://example.com/jobs/1", "2026-01-01T00:00:00"),
+            _entry("https://www.example.com/jobs/1/", "2026-01-02T00:00:00"),
+            _entry("https://example.com/jobs/1?utm_source=x", "2026-01-03T00:00:00"),
+            _entry("https://example.com/jobs/2", "2026-01-02T00:00:00"),
+        ]
+        deduped = _dedup_by_url(entries)
+        assert [d["seen_count"] for d in deduped] == [3, 1]
+
+    def test_keeps_earliest_sighting_in_first_seen_order(self):
+        late = _entry("https://example.com/jobs/1", "2026-01-05T00:00:00", title="Late")
+        other = _entry("https://example.com/jobs/2", "2026-01-03T00:00:00")
+        early = _entry("https://example.com/jobs/1/", "2026-01-01T00:00:00", title="Early")
+        deduped = _dedup_by_url([late, other, early])
+        assert len(deduped) == 2
+        assert deduped[0]["title"] == "Early"
+        assert deduped[0]["seen_count"] == 2
+        assert deduped[1] is other
+
+    def test_falls_back_to_run_id(self):
+        a = {"url": "https://example.com/jobs/1", "run_id": "2026-01-02"}
+        b = {"url": "https://example.com/jobs/1", "run_id": "2026-01-01"}
+        assert _dedup_by_url([a, b]) == [b]
+
+    def test_entries_without_url_kept(self):
+        entries = [
+            _entry(None, "2026-01-01T00:00:00"),
+            _entry("", "2026-01-02T00:00:00"),
+            _entry("https://example.com/jobs/1", "2026-01-03T00:00:00"),
+        ]
+        deduped = _dedup_by_url(entries)
+        assert len(deduped) == 3
+        assert "seen_count" not in deduped[0]
+        assert deduped[2]["seen_count"] == 1
+
+    def test_first_seen_is_earliest_across_duplicates(self):
+        entries = [
+            _entry("https://example.com/jobs/1", "2026-01-03T00:00:00"),
+            _entry("https://example.com/jobs/1/", "2026-01-01T00:00:00"),
+            _entry("https://example.com/jobs/2", "2026-01-02T00:00:00"),
+        ]
+        _add_first_seen(entries)
+        assert [d["first_seen"] for d in entries] == [
+            "2026-01-01T00:00:00",
+            "2026-01-01T00:00:00",
+            "2026-01-02T00:00:00",
+        ]
+        assert entries[0]["_normUrl"] == entries[1]["_normUrl"] == "example.com/jobs/1"
+
+    def test_first_seen_without_url_uses_scraped_at(self):
+        entries = [_entry(None, "2026-01-04T00:00:00")]
+        _add_first_seen(entries)
+        assert entries[0]["first_seen"] == "2026-01-04T00:00:00"
+
+
+# ── Page Payload Tests ──────────────────────────────────────────────────────
+
+
+class TestWriteHtml:
+    """Tests for the data embedded by write_html."""
+
+    ENTRIES = [
+        {
+            "title": 'Senior Scientist, "R&D" <Biologics>',
+            "company": "Amgen & Co",
+            "location": "Thousand Oaks, CA",
+            "source": "greenhouse:amgen",
+            "department": "Research",
+            "url": "https://example.com/jobs/1",
+            "scraped_at": "2026-01-02T00:00:00",
+            "seen_count": 2,
+        },
+        {
+            "title": "QC Analyst",
+            "company": "Gilead",
+            "source": "biospace",
+            "url": "https://example.com/jobs/2",
+            "scraped_at": "2026-01-01T00:00:00",
+            "description_snippet": "Run HPLC assays",
+        },
+    ]
+
+    @pytest.fixture
+    def page(self, tmp_path):
+        """Write ENTRIES; return (html, payload, returned size, file size)."""
+        out = tmp_path / "page.html"
+        entries = [dict(e) for e in self.ENTRIES]
+        size = write_html(entries, "2026-01-03 09:30", out)
+        html = out.read_text(encoding="utf-8")
+        m = re.search(r'<script id="discovery-data" type="text/plain">([^<]*)</script>', html)
+        payload = json.loads(gzip.decompress(base64.b64decode(m.group(1))))
+        return html, payload, size, out.stat().st_size
+
+    def _rows(self, payload):
+        return [dict(zip(payload["cols"], row)) for row in payload["rows"]]
+
+    def test_columnar_shape(self, page):
+        _, payload, _, _ = page
+        assert payload["cols"] == list(_PAYLOAD_COLS)
+        assert len(payload["rows"]) == 2
+        assert all(len(row) == len(_PAYLOAD_COLS) for row in payload["rows"])
+
+    def test_round_trips_entry_fields(self, page):
+        _, payload, _, _ = page
+        rows = self._rows(payload)
+        for entry, row in zip(self.ENTRIES, rows):
+            for k in _PAYLOAD_COLS:
+                if k in entry:
+                    assert row[k] == entry[k]
+        assert rows[1]["location"] is None
+        assert rows[0]["first_seen"] == "2026-01-02T00:00:00"
+        assert rows[0]["_normUrl"] == "example.com/jobs/1"
+
+    def test_search_keys(self, page):
+        _, payload, _, _ = page
+        first, second = self._rows(payload)
+        assert first["_search"] == "\x00".join([
+            'senior scientist, "r&d" <biologics>', "amgen & co", "thousand oaks, ca",
+            "greenhouse:amgen", "research", "",
+        ])
+        assert second["_search"] == "qc analyst\x00gilead\x00\x00biospace\x00\x00run hplc assays"
+        assert first["_sourceBase"] == "greenhouse"
+        assert second["_sourceBase"] == "biospace"
+        assert first["_deptKey"] == "Research"
+        assert second["_deptKey"] == "(none)"
+
+    def test_escaped_columns(self, page):
+        _, payload, _, _ = page
+        first, second = self._rows(payload)
+        assert first["_escTitle"] == "Senior Scientist, &quot;R&amp;D&quot; &lt;Biologics&gt;"
+        assert first["_escCompany"] == "Amgen &amp; Co"
+        assert first["_escSource"] == "greenhouse:amgen"
+        assert second["_escLocation"] == ""
+
+    def test_placeholders_replaced_and_size(self, page):
+        html, _, size, file_size = page
+        assert "2026-01-03 09:30" in html
+        assert "__GENERATED_AT__" not in html
+        assert "__DATA_PLACEHOLDER__" not in html
+        assert size == file_size
+
+
+# ── Command Line Tests ──────────────────────────────────────────────────────
+
+
+class TestMain:
+    """Tests for main()'s dedup flag."""
+
+    LOG = (
+        '{"url": "https://example.com/jobs/1", "scraped_at": "2026-01-01T00:00:00"}\n'
+        '{"url": "https://example.com/jobs/1/", "scraped_at": "2026-01-02T00:00:00"}\n'
+        '{"url": "https://example.com/jobs/2", "scraped_at": "2026-01-01T00:00:00"}\n'
+    )
+
+    @pytest.fixture
+    def written(self, tmp_path, monkeypatch):
+        """Run main() on LOG with the given extra args; return the entries written."""
+        log = tmp_path / "log.jsonl"
+        log.write_text(self.LOG)
+        captured = []
+
+        def fake_write_html(entries, generated_at, out_path):
+            captured.extend(entries)
+            return 0
+
+        monkeypatch.setattr(discovery_viewer, "write_html", fake_write_html)
+
+        def run(*args):
+            argv = ["discovery_viewer.py", "-i", str(log), "-o", str(tmp_path / "out.html"), *args]
+            monkeypatch.setattr(sys, "argv", argv)
+            discovery_viewer.main()
+            return captured
+
+        return run
+
+    def test_dedups_by_default(self, written):
+        entries = written()
+        assert len(entries) == 2
+        assert entries[0]["seen_count"] == 2
+
+    def test_no_dedup_passes_entries_through(self, written):
+        entries = written("--no-dedup")
+        assert entries == [
+            {"url": "https://example.com/jobs/1", "scraped_at": "2026-01-01T00:00:00"},
+            {"url": "https://example.com/jobs/1/", "scraped_at": "2026-01-02T00:00:00"},
+            {"url": "https://example.com/jobs/2", "scraped_at": "2026-01-01T00:00:00"},
+        ]
@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import json
+import logging
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -19,6 +20,7 @@ import pytest
 from src.config import MatchCriteria, PipelineConfig
 from src.matcher import (
     FilterResult,
+    InMemorySink,
     RejectionReason,
     apply_age_filter,
     apply_duplicate_filter,
@@ -158,6 +160,12 @@ class TestParseDatePosted:
         expected = datetime.now(timezone.utc) - timedelta(weeks=2)
         assert result.date() == expected.date()
 
+    def test_relative_uses_given_now(self):
+        """Relative dates resolve against an explicit reference time."""
+        now = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+        assert parse_posted_date("5 days ago", now=now) == now - timedelta(days=5)
+        assert parse_posted_date("today", now=now) == now
+
     def test_month_day_year(self):
         """Parse 'Feb 1, 2026' format."""
         result = parse_posted_date("Feb 1, 2026")
@@ -309,6 +317,50 @@ class TestAgeFilter:
         assert len(passed) == 1
         assert len(rejected) == 0
 
+    def test_old_iso_datetime_rejected(self):
+        """Full ISO timestamps are compared by date ordinal."""
+        old = (datetime.now(timezone.utc) - timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        jobs = [
+            JobPosting(
+                title="Test",
+                company="Test",
+                url="https://test.com/1",
+                source="test",
+                posted_date=old,
+            )
+        ]
+        passed, rejected = apply_age_filter(jobs, max_age_days=14)
+        assert len(passed) == 0
+        assert rejected[0].reason == RejectionReason.AGE
+
+    def test_old_relative_date_rejected(self):
+        """Relative dates still go through parse_posted_date."""
+        jobs = [
+            JobPosting(
+                title="Test",
+                company="Test",
+                url="https://test.com/1",
+                source="test",
+                posted_date="30+ days ago",
+            )
+        ]
+        passed, rejected = apply_age_filter(jobs, max_age_days=14)
+        assert len(passed) == 0
+        assert len(rejected) == 1
+
+    def test_uses_given_now(self):
+        """The cutoff is computed from an explicit reference time."""
+        now = datetime(2026, 2, 10, tzinfo=timezone.utc)
+        jobs = [
+            JobPosting(title="Test", company="Test", url="https://test.com/1",
+                       source="test", posted_date="2026-02-01"),
+            JobPosting(title="Test", company="Test", url="https://test.com/2",
+                       source="test", posted_date="2026-01-01"),
+        ]
+        passed, rejected = apply_age_filter(jobs, max_age_days=14, now=now)
+        assert [j.url for j in passed] == ["https://test.com/1"]
+        assert len(rejected) == 1
+
     def test_unparseable_date_passes(self):
         """Jobs with unparseable dates pass (fail open)."""
         jobs = [
@@ -372,6 +424,20 @@ class TestTitleFilter:
         assert len(passed) == 0
         assert rejected[0].reason == RejectionReason.TITLE_EXCLUDE
 
+    def test_overlapping_exclude_rejected(self):
+        """An exclude keyword overlapping an include keyword still rejects."""
+        jobs = [
+            JobPosting(
+                title="Drug Product Manager",
+                company="Test",
+                url="https://test.com/1",
+                source="test",
+            )
+        ]
+        passed, rejected = apply_title_filter(jobs, ["drug product"], ["product manager"])
+        assert len(passed) == 0
+        assert rejected[0].reason == RejectionReason.TITLE_EXCLUDE
+
     def test_no_include_match_rejected(self):
         """Jobs not matching any include keyword are rejected."""
         jobs = [
@@ -386,6 +452,29 @@ class TestTitleFilter:
         assert len(passed) == 0
         assert rejected[0].reason == RejectionReason.TITLE_NO_MATCH
 
+    def test_blank_keyword_matches_every_title(self):
+        """A blank keyword matches everything, as in title_matches_include/exclude."""
+        jobs = [
+            JobPosting(
+                title="Sales Representative",
+                company="Test",
+                url="https://test.com/1",
+                source="test",
+            )
+        ]
+        assert title_matches_include("Sales Representative", [""])
+        assert title_matches_exclude("Sales Representative", [""])
+
+        passed, rejected = apply_title_filter(jobs, [""], [])
+        assert len(passed) == 1
+
+        passed, rejected = apply_title_filter(jobs, ["scientist", ""], [])
+        assert len(passed) == 1
+
+        passed, rejected = apply_title_filter(jobs, [], [""])
+        assert len(passed) == 0
+        assert rejected[0].reason == RejectionReason.TITLE_EXCLUDE
+
 
 # ── Full Pipeline Tests ─────────────────────────────────────────────────────
 
@@ -405,6 +494,59 @@ class TestCheapFilters:
         assert RejectionReason.DUPLICATE in reasons  # job/1
         assert RejectionReason.TITLE_EXCLUDE in reasons  # QC Analyst, Director, Intern
 
+    def test_first_failing_filter_wins(self, default_config):
+        """Each job is rejected once, by the earliest filter it fails."""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        old = (datetime.now(timezone.utc) - timedelta(days=60)).strftime("%Y-%m-%d")
+        jobs = [
+            # Duplicate, old and excluded — duplicate wins
+            JobPosting(title="Intern", company="A", url="https://x.com/1",
+                       source="test", posted_date=old),
+            # Old and excluded — age wins
+            JobPosting(title="Intern", company="A", url="https://x.com/2",
+                       source="test", posted_date=old),
+            # Recent but excluded
+            JobPosting(title="Intern", company="A", url="https://x.com/3",
+                       source="test", posted_date=today),
+            # Recent, no include match
+            JobPosting(title="Sales Lead", company="A", url="https://x.com/4",
+                       source="test", posted_date=today),
+            # Passes everything
+            JobPosting(title="Senior Scientist", company="A", url="https://x.com/5",
+                       source="test", posted_date=today),
+        ]
+        passed, rejected = cheap_filters(jobs, {"https://x.com/1"}, default_config)
+
+        assert [j.url for j in passed] == ["https://x.com/5"]
+        assert [(r.job.url, r.reason) for r in rejected] == [
+            ("https://x.com/1", RejectionReason.DUPLICATE),
+            ("https://x.com/2", RejectionReason.AGE),
+            ("https://x.com/3", RejectionReason.TITLE_EXCLUDE),
+            ("https://x.com/4", RejectionReason.TITLE_NO_MATCH),
+        ]
+
+    def test_logs_per_filter_counts(self, default_config, caplog):
+        """Each filter stage logs its passed/rejected counts."""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        old = (datetime.now(timezone.utc) - timedelta(days=60)).strftime("%Y-%m-%d")
+        jobs = [
+            JobPosting(title="Senior Scientist", company="A", url="https://x.com/1",
+                       source="test", posted_date=today),
+            JobPosting(title="Senior Scientist", company="A", url="https://x.com/2",
+                       source="test", posted_date=old),
+            JobPosting(title="Intern", company="A", url="https://x.com/3",
+                       source="test", posted_date=today),
+            JobPosting(title="Senior Scientist", company="A", url="https://x.com/4",
+                       source="test", posted_date=today),
+        ]
+        with caplog.at_level(logging.DEBUG, logger="src.matcher"):
+            cheap_filters(jobs, {"https://x.com/1"}, default_config)
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert "Duplicate filter: 3 passed, 1 rejected" in messages
+        assert "Age filter: 2 passed, 1 rejected" in messages
+        assert "Title filter: 1 passed, 1 rejected" in messages
+
     def test_empty_input(self, default_config):
         """Empty job list returns empty results."""
         passed, rejected = cheap_filters([], set(), default_config)
@@ -431,6 +573,22 @@ class TestCandidatesFile:
             assert loaded[0]["title"] == "Senior Scientist, Drug Product"
             assert loaded[1]["company"] == "Amgen"
 
+    def test_write_reuses_cached_record(self, sample_jobs):
+        """A job's serialized record is cached and reused on rewrite."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_candidates(sample_jobs[:1], tmpdir)
+            first = (Path(tmpdir) / "candidates.json").read_bytes()
+
+            def must_not_reserialize(job):
+                raise AssertionError("record was serialized twice")
+
+            cached = sample_jobs[0].cached_json(must_not_reserialize)
+            assert cached in first
+
+            write_candidates(sample_jobs[:1], tmpdir)
+            assert (Path(tmpdir) / "candidates.json").read_bytes() == first
+            assert load_candidates(tmpdir)[0]["url"] == "https://example.com/job/1"
+
     def test_write_creates_directory(self, sample_jobs):
         """Writing creates the data directory if missing."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -498,6 +656,48 @@ class TestRunMatching:
             assert "Director of CMC" not in titles
             assert "Intern, Research" not in titles
 
+    def test_in_memory_sink(self, default_config):
+        """run_matching hands candidates to the given sink without touching disk."""
+        # Dated relative to today so the age filter can't empty the sink
+        recent = (datetime.now(timezone.utc) - timedelta(days=2)).date().isoformat()
+        jobs = [
+            JobPosting(
+                title="Formulation Scientist",
+                company="BridgeBio",
+                url="https://example.com/job/10",
+                source="greenhouse:bridgebio",
+                posted_date=recent,
+            ),
+            JobPosting(
+                title="Director of Formulation",
+                company="Gilead",
+                url="https://example.com/job/11",
+                source="workday:gilead",
+                posted_date=recent,
+            ),
+            JobPosting(
+                title="Scientist, Drug Product",
+                company="Amgen",
+                url="https://example.com/job/12",
+                source="talentbrew:amgen",
+                location="Thousand Oaks, CA",
+                posted_date=recent,
+            ),
+        ]
+        sink = InMemorySink()
+        path, rejections = run_matching(jobs, set(), default_config, sink=sink)
+
+        assert path == sink.path
+        assert not path.exists()
+        assert [(c["url"], c["title"], c["company"]) for c in sink.candidates] == [
+            ("https://example.com/job/10", "Formulation Scientist", "BridgeBio"),
+            ("https://example.com/job/12", "Scientist, Drug Product", "Amgen"),
+        ]
+        assert sink.candidates[1]["location"] == "Thousand Oaks, CA"
+        assert sink.candidates[1]["date_posted"] == recent
+        assert [r.job.title for r in rejections] == ["Director of Formulation"]
+        assert sink.load() == sink.candidates
+
 
 class TestRejectionSummary:
     """Tests for rejection summary generation."""
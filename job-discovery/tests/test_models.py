@@ -59,3 +59,70 @@ def test_to_dict():
     assert d["title"] == "Analyst"
     assert "fingerprint" in d
     assert isinstance(d["fingerprint"], str)
+
+
+def test_posted_ordinal_from_iso_date():
+    job = JobPosting(
+        title="A", company="B",
+        url="https://example.com/jobs/1",
+        source="test",
+        posted_date="1970-01-11T09:00:00Z",
+    )
+    assert job.posted_ordinal == 10
+
+
+def test_posted_ordinal_none_for_relative_date():
+    job = JobPosting(
+        title="A", company="B",
+        url="https://example.com/jobs/1",
+        source="test",
+        posted_date="3 days ago",
+    )
+    assert job.posted_ordinal is None
+    assert "posted_ordinal" not in job.to_dict()
+
+
+def test_missing_company_allowed():
+    # A source config with an empty `company:` key yields company=None
+    job = JobPosting(title="A", company=None, url="https://example.com/1", source="test")
+    assert job.company is None
+    assert job.to_dict()["company"] is None
+
+
+def test_missing_title_allowed():
+    job = JobPosting(title=None, company="B", url="https://example.com/1", source="test")
+    assert job.title is None
+    assert job.title_lower == ""
+
+
+def test_missing_url_allowed():
+    job = JobPosting(title="A", company="B", url=None, source="test")
+    assert job.url is None
+    assert job.fingerprint == JobPosting(title="A", company="B", url="", source="t").fingerprint
+
+
+def test_title_lower_precomputed():
+    job = JobPosting(title="Senior SCIENTIST", company="B",
+                     url="https://example.com/1", source="test")
+    assert job.title_lower == "senior scientist"
+    assert "title_lower" not in job.to_dict()
+
+
+def test_job_posting_has_no_instance_dict():
+    job = JobPosting(title="A", company="B", url="https://example.com/1", source="test")
+    # Slotted dataclass — no per-instance __dict__
+    assert not hasattr(job, "__dict__")
+
+
+def test_cached_json_serializes_once():
+    job = JobPosting(title="A", company="B", url="https://example.com/1", source="test")
+    calls = []
+
+    def serialize(j):
+        calls.append(j)
+        return b'{"title": "A"}'
+
+    first = job.cached_json(serialize)
+    assert job.cached_json(serialize) is first
+    assert calls == [job]
+    assert "_json_cache" not in job.to_dict()
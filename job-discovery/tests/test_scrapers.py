@@ -4,56 +4,52 @@ import json
 
 import responses
 
-from src.config import ScraperConfig, PipelineConfig
+from src.config import ScraperConfig
 from src.scrapers.greenhouse import GreenhouseScraper
 from src.scrapers.workday import WorkdayScraper
 
 
 # --- Greenhouse Scraper Tests ---
 
+GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards/testco/jobs"
+
+GREENHOUSE_SOURCE = ScraperConfig(
+    name="test-greenhouse",
+    scraper_type="greenhouse",
+    company="TestCo",
+    params={"board_token": "testco"},
+)
+
+GREENHOUSE_DATA = {
+    "jobs": [
+        {
+            "id": 12345,
+            "title": "Senior Scientist",
+            "absolute_url": "https://boards.greenhouse.io/testco/jobs/12345",
+            "location": {"name": "San Francisco, CA"},
+            "departments": [{"name": "Research"}],
+            "content": "<p>Join our team as a Senior Scientist.</p>",
+            "updated_at": "2026-01-15T10:00:00Z",
+        },
+        {
+            "id": 67890,
+            "title": "Research Associate",
+            "absolute_url": "https://boards.greenhouse.io/testco/jobs/67890",
+            "location": {"name": "Remote"},
+            "departments": [],
+            "content": "",
+            "updated_at": "2026-02-01T10:00:00Z",
+        },
+    ]
+}
+
+
 @responses.activate
-def test_greenhouse_scraper_parses_api_response():
+def test_greenhouse_scraper_parses_api_response(default_config):
     """Greenhouse scraper should parse the JSON API correctly."""
-    api_url = "https://boards-api.greenhouse.io/v1/boards/testco/jobs"
-
-    mock_data = {
-        "jobs": [
-            {
-                "id": 12345,
-                "title": "Senior Scientist",
-                "absolute_url": "https://boards.greenhouse.io/testco/jobs/12345",
-                "location": {"name": "San Francisco, CA"},
-                "departments": [{"name": "Research"}],
-                "content": "<p>Join our team as a Senior Scientist.</p>",
-                "updated_at": "2026-01-15T10:00:00Z",
-            },
-            {
-                "id": 67890,
-                "title": "Research Associate",
-                "absolute_url": "https://boards.greenhouse.io/testco/jobs/67890",
-                "location": {"name": "Remote"},
-                "departments": [],
-                "content": "",
-                "updated_at": "2026-02-01T10:00:00Z",
-            },
-        ]
-    }
-
-    responses.add(
-        responses.GET,
-        api_url,
-        json=mock_data,
-        status=200,
-    )
-
-    source = ScraperConfig(
-        name="test-greenhouse",
-        scraper_type="greenhouse",
-        company="TestCo",
-        params={"board_token": "testco"},
-    )
-    pipeline = PipelineConfig()
-    scraper = GreenhouseScraper(source, pipeline)
+    responses.add(responses.GET, GREENHOUSE_API, json=GREENHOUSE_DATA, status=200)
+
+    scraper = GreenhouseScraper(GREENHOUSE_SOURCE, default_config)
     jobs = scraper.scrape()
 
     assert len(jobs) == 2
@@ -67,63 +63,53 @@ def test_greenhouse_scraper_parses_api_response():
 
 
 @responses.activate
-def test_greenhouse_scraper_handles_empty_response():
+def test_greenhouse_scraper_handles_empty_response(default_config):
     """Greenhouse scraper should handle an empty jobs list."""
-    api_url = "https://boards-api.greenhouse.io/v1/boards/emptyco/jobs"
-
-    responses.add(responses.GET, api_url, json={"jobs": []}, status=200)
-
-    source = ScraperConfig(
-        name="test-empty",
-        scraper_type="greenhouse",
-        company="EmptyCo",
-        params={"board_token": "emptyco"},
-    )
-    pipeline = PipelineConfig()
-    scraper = GreenhouseScraper(source, pipeline)
-    jobs = scraper.scrape()
+    responses.add(responses.GET, GREENHOUSE_API, json={"jobs": []}, status=200)
 
-    assert jobs == []
+    scraper = GreenhouseScraper(GREENHOUSE_SOURCE, default_config)
+    assert scraper.scrape() == []
 
 
 # --- Workday Scraper Tests ---
 
+WORKDAY_API = "https://testco.wd1.myworkdayjobs.com/wday/cxs/testco/careers/jobs"
+
+WORKDAY_SOURCE = ScraperConfig(
+    name="test-workday",
+    scraper_type="workday",
+    url="https://testco.wd1.myworkdayjobs.com",
+    company="TestCo",
+    params={"tenant": "testco", "site": "careers", "max_pages": 1},
+)
+
+WORKDAY_DATA = {
+    "total": 2,
+    "jobPostings": [
+        {
+            "title": "Director, Clinical Operations",
+            "externalPath": "/job/Director-Clinical-Operations/123",
+            "locationsText": "Foster City, CA",
+            "postedOn": "2026-01-20",
+            "bulletFields": ["Full Time", "R&D"],
+        },
+        {
+            "title": "Medical Writer",
+            "externalPath": "/job/Medical-Writer/456",
+            "locationsText": "Remote",
+            "postedOn": "2026-02-01",
+            "bulletFields": ["Full Time"],
+        },
+    ],
+}
+
+
 @responses.activate
-def test_workday_scraper_parses_api_response():
+def test_workday_scraper_parses_api_response(default_config):
     """Workday scraper should parse the internal API response."""
-    api_url = "https://testco.wd1.myworkdayjobs.com/wday/cxs/testco/careers/jobs"
-
-    mock_data = {
-        "total": 2,
-        "jobPostings": [
-            {
-                "title": "Director, Clinical Operations",
-                "externalPath": "/job/Director-Clinical-Operations/123",
-                "locationsText": "Foster City, CA",
-                "postedOn": "2026-01-20",
-                "bulletFields": ["Full Time", "R&D"],
-            },
-            {
-                "title": "Medical Writer",
-                "externalPath": "/job/Medical-Writer/456",
-                "locationsText": "Remote",
-                "postedOn": "2026-02-01",
-                "bulletFields": ["Full Time"],
-            },
-        ],
-    }
-
-    responses.add(responses.POST, api_url, json=mock_data, status=200)
-
-    source = ScraperConfig(
-        name="test-workday",
-        scraper_type="workday",
-        url="https://testco.wd1.myworkdayjobs.com",
-        company="TestCo",
-        params={"tenant": "testco", "site": "careers", "max_pages": 1},
-    )
-    pipeline = PipelineConfig()
-    scraper = WorkdayScraper(source, pipeline)
+    responses.add(responses.POST, WORKDAY_API, json=WORKDAY_DATA, status=200)
+
+    scraper = WorkdayScraper(WORKDAY_SOURCE, default_config)
     jobs = scraper.scrape()
 
     assert len(jobs) == 2
@@ -132,3 +118,12 @@ def test_workday_scraper_parses_api_response():
     assert jobs[0].source == "workday:testco"
     assert "/job/Director" in jobs[0].url
     assert jobs[1].title == "Medical Writer"
+
+
+@responses.activate
+def test_workday_scraper_handles_empty_response(default_config):
+    """Workday scraper should handle an empty postings list."""
+    responses.add(responses.POST, WORKDAY_API, json={"total": 0, "jobPostings": []}, status=200)
+
+    scraper = WorkdayScraper(WORKDAY_SOURCE, default_config)
+    assert scraper.scrape() == []
@@ -13,37 +13,298 @@ with search, filtering, sorting, stats, and more.
 from __future__ import annotations
 
 import argparse
+import base64
+import functools
+import gzip
+import itertools
 import json
+import mmap
+import os
+import re
 import sys
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import parse_qsl
+
+try:
+    import orjson
+except ImportError:  # optional speedup — fall back to stdlib json
+    orjson = None
 
 DEFAULT_INPUT = Path(__file__).resolve().parent.parent / "data" / "discovery_log.jsonl"
 DEFAULT_OUTPUT = Path(__file__).resolve().parent.parent / "output" / "discovery_viewer.html"
 
 
+_NEWLINE = re.compile(rb"\n")
+# Logs at least this big are parsed in chunks across worker processes;
+# below it, unpickling the workers' results costs about what parsing saves
+_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+
 def load_jsonl(path: Path) -> list[dict]:
-    """Load a JSONL file, skipping malformed lines."""
-    entries = []
-    with open(path, "r") as f:
-        for i, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    """Load a JSONL file, skipping malformed lines.
+
+    The file is memory-mapped and turned into one JSON array (newlines ->
+    commas) straight from the mapping, then parsed in a single call. If
+    that fails — a malformed or blank line somewhere — fall back to
+    parsing line by line so the bad lines can be reported and skipped.
+    Logs over _PARALLEL_MIN_BYTES are split on line boundaries and the
+    chunks parsed the same way in a process pool.
+    """
+    if orjson is not None:
+        loads, decode_error = orjson.loads, orjson.JSONDecodeError
+    else:
+        loads, decode_error = json.loads, json.JSONDecodeError
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            workers = os.cpu_count() or 1
+            if size >= _PARALLEL_MIN_BYTES and workers > 1:
+                try:
+                    return _load_parallel(path, mm, workers)
+                except decode_error:
+                    return _load_lines(mm, loads, decode_error)
+            body = _NEWLINE.sub(b",", mm).strip(b", \t\r")
+            if not body:
+                return []
             try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                print(f"  Warning: skipped malformed line {i}", file=sys.stderr)
+                return loads(b"[" + body + b"]")
+            except decode_error:
+                pass
+            del body
+            return _load_lines(mm, loads, decode_error)
+
+
+def _load_parallel(path: Path, mm: mmap.mmap, workers: int) -> list[dict]:
+    """Parse a large JSONL file in line-aligned chunks across processes.
+
+    Raises the JSON decode error of the first chunk that fails.
+    """
+    size = len(mm)
+    bounds = [0]
+    for i in range(1, workers):
+        cut = mm.find(b"\n", max(size * i // workers, bounds[-1]))
+        if cut == -1:
+            break
+        bounds.append(cut + 1)
+    bounds.append(size)
+    spans = [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+    with ProcessPoolExecutor(max_workers=len(spans)) as pool:
+        chunks = pool.map(_parse_chunk, itertools.repeat(path), *zip(*spans))
+        return list(itertools.chain.from_iterable(chunks))
+
+
+def _parse_chunk(path: Path, start: int, end: int) -> list[dict]:
+    """Worker: bulk-parse the JSONL lines in bytes [start, end) of path."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        f.seek(start)
+        body = _NEWLINE.sub(b",", f.read(end - start)).strip(b", \t\r")
+    return loads(b"[" + body + b"]") if body else []
+
+
+def _load_lines(mm: mmap.mmap, loads, decode_error) -> list[dict]:
+    """Parse a mapped JSONL file one line at a time, skipping bad lines."""
+    entries = []
+    pos, size, lineno = 0, len(mm), 0
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end == -1:
+            end = size
+        lineno += 1
+        line = mm[pos:end].strip()
+        pos = end + 1
+        if not line:
+            continue
+        try:
+            entries.append(loads(line))
+        except decode_error:
+            print(f"  Warning: skipped malformed line {lineno}", file=sys.stderr)
     return entries
 
 
-def generate_html(entries: list[dict], generated_at: str) -> str:
-    """Generate the full self-contained HTML page."""
-    data_json = json.dumps(entries, ensure_ascii=False)
-    return HTML_TEMPLATE.replace("__DATA_PLACEHOLDER__", data_json).replace(
-        "__GENERATED_AT__", generated_at
-    )
+# Query params that don't identify a job (same list the page used to apply)
+_TRACKING_PARAMS = frozenset({
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "source", "ref", "src", "trk", "linksource", "gh_jid", "gh_src",
+})
+# Leading scheme/"www." and trailing slashes, stripped in one pass
+_URL_STRIP = re.compile(r"^(?:https?://)?(?:www\.)?|/+$")
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_url(url: str | None) -> str:
+    """Normalize a URL for grouping log entries that point at the same job.
+
+    Drops the scheme and "www.", lowercases, strips trailing slashes and
+    removes tracking query params. A fragment is kept (hash-routed job
+    boards put the job id there) but split off first, so it is neither
+    parsed as part of the last query param nor blocks the slash strip.
+    Cached, since the log repeats each posting's URL on every run that
+    sees it.
+    """
+    if not url:
+        return ""
+    u, _, frag = url.strip().partition("#")
+    u = _URL_STRIP.sub("", u).lower()
+    if "?" in u:
+        path, _, qs = u.partition("?")
+        path = path.rstrip("/")
+        clean = [
+            f"{k}={v}"
+            for k, v in parse_qsl(qs, keep_blank_values=True)
+            if k not in _TRACKING_PARAMS
+        ]
+        u = path + "?" + "&".join(clean) if clean else path
+    return u + "#" + frag.lower() if frag else u
+
+
+def _seen_at(d: dict) -> str:
+    """When a log entry was recorded: scraped_at, falling back to run_id."""
+    return d.get("scraped_at") or d.get("run_id") or ""
+
+
+def _dedup_by_url(entries: list[dict]) -> list[dict]:
+    """Collapse repeat sightings of the same job into one entry.
+
+    Keeps the earliest entry per normalized URL, in first-seen order, and
+    records how many log entries it stands for in seen_count. Entries
+    without a URL are kept as-is.
+    """
+    slots: dict[str, int] = {}
+    out: list[dict] = []
+    for d in entries:
+        norm = _normalize_url(d.get("url"))
+        if not norm:
+            out.append(d)
+            continue
+        i = slots.get(norm)
+        if i is None:
+            slots[norm] = len(out)
+            d["seen_count"] = 1
+            out.append(d)
+            continue
+        kept = out[i]
+        count = kept["seen_count"] + 1
+        if _seen_at(d) < _seen_at(kept):
+            out[i] = kept = d
+        kept["seen_count"] = count
+    return out
+
+
+def _add_first_seen(entries: list[dict]) -> None:
+    """Stamp each entry with its normalized URL and first-seen time.
+
+    first_seen is the earliest scraped_at (or run_id) among all entries
+    sharing the normalized URL.
+    """
+    first_seen: dict[str, str] = {}
+    for d in entries:
+        norm = d["_normUrl"] = _normalize_url(d.get("url"))
+        if not norm:
+            continue
+        ts = _seen_at(d)
+        if norm not in first_seen or ts < first_seen[norm]:
+            first_seen[norm] = ts
+
+    for d in entries:
+        d["first_seen"] = first_seen.get(d["_normUrl"]) or d.get("scraped_at") or ""
+
+
+# Fields the page's search box matches against, in _search order
+_SEARCH_FIELDS = ("title", "company", "location", "source", "department", "description_snippet")
+
+
+def _add_search_keys(entries: list[dict]) -> None:
+    """Stamp each entry with its lowercased search string and group keys.
+
+    _search joins the searchable fields with NUL so a search term can't
+    match across two fields; _sourceBase is the scraper type ("greenhouse"
+    for "greenhouse:bridgebio"); _deptKey is the department, or "(none)"
+    as the sidebar lists it.
+    """
+    for d in entries:
+        d["_search"] = "\x00".join(
+            str(v) if (v := d.get(k)) is not None else "" for k in _SEARCH_FIELDS
+        ).lower()
+        d["_sourceBase"] = (d.get("source") or "").split(":", 1)[0]
+        d["_deptKey"] = d.get("department") or "(none)"
+
+
+# Columns the table renders as HTML, pre-escaped into _esc<Name> fields
+_ESCAPED_FIELDS = ("title", "company", "location", "source")
+# Same characters as the page's esc() helper
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _add_escaped_columns(entries: list[dict]) -> None:
+    """Stamp each entry with HTML-escaped copies of the table's text columns.
+
+    The page splices these in as-is instead of escaping every cell on
+    every render.
+    """
+    for d in entries:
+        for k in _ESCAPED_FIELDS:
+            v = d.get(k)
+            d["_esc" + k.capitalize()] = str(v).translate(_HTML_ESCAPES) if v else ""
+
+
+# Entry fields the page uses, in payload column order
+_PAYLOAD_COLS = (
+    "title", "company", "location", "source", "department", "url",
+    "date_posted", "scraped_at", "description_snippet", "first_seen",
+    "seen_count", "_normUrl", "_search", "_sourceBase", "_deptKey",
+    "_escTitle", "_escCompany", "_escLocation", "_escSource",
+)
+
+
+def _columnar(entries: list[dict]) -> dict:
+    """Pack entries as {"cols": [...], "rows": [[...], ...]}.
+
+    Each row is a list in _PAYLOAD_COLS order, so key names are written
+    once instead of once per entry.
+    """
+    return {
+        "cols": _PAYLOAD_COLS,
+        "rows": [[d.get(c) for c in _PAYLOAD_COLS] for d in entries],
+    }
+
+
+def _dumps(obj) -> bytes:
+    """Compact UTF-8 JSON with non-ASCII characters kept as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def write_html(entries: list[dict], generated_at: str, out_path: Path) -> int:
+    """Write the full self-contained HTML page to out_path.
+
+    The page is streamed part by part so the serialized data is never
+    copied into one large page string. Returns the number of bytes written.
+    """
+    _add_first_seen(entries)
+    _add_search_keys(entries)
+    _add_escaped_columns(entries)
+    # Gzipped and base64-encoded; the page inflates it with
+    # DecompressionStream. Base64 also keeps the data from closing the
+    # <script> block it is embedded in.
+    payload = gzip.compress(_dumps(_columnar(entries)), compresslevel=6)
+    values = {
+        "__DATA_PLACEHOLDER__": base64.b64encode(payload),
+        "__GENERATED_AT__": generated_at.encode("utf-8"),
+    }
+    size = 0
+    with open(out_path, "wb") as f:
+        # Odd indices of the split template are the placeholder tokens
+        for i, part in enumerate(_TEMPLATE_PARTS):
+            size += f.write(values[part] if i % 2 else part.encode("utf-8"))
+    return size
 
 
 HTML_TEMPLATE = r"""<!DOCTYPE html>
@@ -79,7 +340,7 @@ HTML_TEMPLATE = r"""<!DOCTYPE html>
 body {
   font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', sans-serif;
   background: var(--bg); color: var(--text); line-height: 1.5;
-  overflow-x: hidden;
+  overflow: hidden; height: 100vh; display: flex; flex-direction: column;
 }
 a { color: var(--accent); text-decoration: none; }
 a:hover { text-decoration: underline; }
@@ -89,7 +350,7 @@ a:hover { text-decoration: underline; }
 .header {
   background: var(--bg-card); border-bottom: 1px solid var(--border);
   padding: 12px 24px; display: flex; align-items: center; gap: 16px;
-  position: sticky; top: 0; z-index: 100;
+  flex-shrink: 0; position: relative; z-index: 100;
 }
 .header h1 {
   font-size: 15px; font-weight: 600; white-space: nowrap;
@@ -121,13 +382,16 @@ a:hover { text-decoration: underline; }
 .search-bar .clear-btn:hover { color: var(--text); border-color: var(--text-muted); }
 
 /* ── Layout ─────────────────────────────────────────── */
-.container { display: flex; min-height: calc(100vh - 49px); }
+/* The page itself never scrolls: the container takes the height left
+   under the header, so the sidebar and .table-wrap are the scroll
+   containers (the virtualized table body windows on .table-wrap) */
+.container { display: flex; flex: 1; min-height: 0; }
 
 /* ── Sidebar ────────────────────────────────────────── */
 .sidebar {
   width: 240px; min-width: 240px; background: var(--bg-card);
   border-right: 1px solid var(--border); padding: 12px;
-  overflow-y: auto; max-height: calc(100vh - 49px); position: sticky; top: 49px;
+  overflow-y: auto;
 }
 .sidebar h3 {
   font-size: 10px; text-transform: uppercase; letter-spacing: 1.2px;
@@ -136,6 +400,8 @@ a:hover { text-decoration: underline; }
 }
 .sidebar h3:first-child { margin-top: 4px; }
 .filter-group { margin-bottom: 1px; }
+.filter-group[data-overflow] { display: none; }
+.show-all .filter-group[data-overflow] { display: block; }
 .filter-btn {
   display: flex; align-items: center; gap: 6px; width: 100%;
   padding: 5px 6px; border: none; background: none; color: var(--text-dim);
@@ -188,8 +454,8 @@ a:hover { text-decoration: underline; }
 .stat-card .sub { font-size: 11px; color: var(--text-dim); margin-top: 1px; }
 
 /* ── Main content ───────────────────────────────────── */
-.main { flex: 1; padding: 0; overflow: hidden; display: flex; flex-direction: column; }
-.table-wrap { flex: 1; overflow: auto; }
+.main { flex: 1; min-width: 0; min-height: 0; padding: 0; overflow: hidden; display: flex; flex-direction: column; }
+.table-wrap { flex: 1; min-height: 0; overflow: auto; }
 .toolbar {
   display: flex; align-items: center; gap: 10px; padding: 8px 24px;
   border-bottom: 1px solid var(--border); flex-wrap: wrap;
@@ -236,17 +502,24 @@ a:hover { text-decoration: underline; }
 .jobs-table tbody tr.job-row:hover { background: var(--bg-hover); }
 .jobs-table tbody tr.job-row.expanded { background: var(--accent-bg); }
 .jobs-table tbody td { padding: 0; vertical-align: top; }
+/* fixed row height so the virtualized body can position rows by index;
+   a cell can't be shorter than its content, so every cell's content is
+   clamped to fit */
+.jobs-table tbody tr.job-row td { height: 76px; padding: 10px 14px; overflow: hidden; }
+.jobs-table tbody tr.spacer-row td { padding: 0; border: none; }
 
 /* ── Cell contents ──────────────────────────────────── */
-.cell { padding: 10px 14px; }
-.cell-title .title-text { font-weight: 500; color: var(--text); line-height: 1.35; }
+.cell-title .title-text {
+  font-weight: 500; color: var(--text); line-height: 1.35;
+  display: -webkit-box; -webkit-line-clamp: 2; -webkit-box-orient: vertical; overflow: hidden;
+}
 .cell-title .desc-preview {
   font-size: 11px; color: var(--text-muted); margin-top: 2px;
-  line-height: 1.4; display: -webkit-box; -webkit-line-clamp: 2;
-  -webkit-box-orient: vertical; overflow: hidden;
+  line-height: 1.4; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;
 }
 .cell-company { color: var(--text-dim); font-size: 12.5px; }
 .cell-location { color: var(--text-muted); font-size: 12px; }
+.cell-company, .cell-location { white-space: nowrap; text-overflow: ellipsis; }
 .cell-date { color: var(--text-muted); font-size: 11.5px; white-space: nowrap; }
 .cell-date .date-exact { display: none; }
 .cell-date:hover .date-relative { display: none; }
@@ -284,8 +557,10 @@ a:hover { text-decoration: underline; }
 .detail-panel {
   background: var(--bg-card); border: 1px solid var(--border);
   border-radius: var(--radius); margin: 0 14px 10px;
-  padding: 14px 18px; animation: slideDown 0.12s ease;
+  padding: 14px 18px;
 }
+/* played once when a row is expanded, not each time rows are rebuilt */
+.detail-panel.opening { animation: slideDown 0.12s ease; }
 @keyframes slideDown { from { opacity:0; max-height:0; } to { opacity:1; max-height:600px; } }
 .detail-grid {
   display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
@@ -296,7 +571,13 @@ a:hover { text-decoration: underline; }
   letter-spacing: 0.8px; display: block; margin-bottom: 1px; font-weight: 500;
 }
 .detail-field .val { font-size: 13px; word-break: break-word; }
+.detail-field .val.scraped-at { font-size: 11px; color: var(--text-dim); }
+.detail-field .empty { color: var(--text-muted); }
 .url-row { display: flex; align-items: center; gap: 8px; margin-bottom: 10px; }
+.url-label {
+  font-size: 9px; text-transform: uppercase; color: var(--text-muted);
+  letter-spacing: 0.8px; font-weight: 500; flex-shrink: 0;
+}
 .url-row a {
   font-size: 12px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; flex: 1;
 }
@@ -347,6 +628,7 @@ mark { background: rgba(108,122,255,0.3); color: var(--text); border-radius: 2px
 /* ── Empty state ────────────────────────────────────── */
 .empty-state { text-align: center; padding: 60px 20px; color: var(--text-muted); }
 .empty-state p { font-size: 13px; margin-top: 8px; }
+.empty-state .empty-title { font-size: 32px; margin-bottom: 8px; }
 
 /* ── Toast ──────────────────────────────────────────── */
 .toast {
@@ -435,6 +717,7 @@ mark { background: rgba(108,122,255,0.3); color: var(--text); border-radius: 2px
         </thead>
         <tbody id="tableBody"></tbody>
       </table>
+      <div class="detail-panel" id="detailPanel" hidden></div>
     </div>
     <div class="pagination" id="pagination"></div>
   </div>
@@ -446,56 +729,27 @@ mark { background: rgba(108,122,255,0.3); color: var(--text); border-radius: 2px
   <span><kbd>&larr;</kbd><kbd>&rarr;</kbd> Pages</span>
 </div>
 
-<script>
+<template id="rowTpl"><tr class="job-row">
+  <td class="cell-title"><span class="expand-hint"></span><div class="title-text"></div><div class="desc-preview"></div></td>
+  <td class="cell-company"></td>
+  <td class="cell-location"></td>
+  <td><span class="badge"></span></td>
+  <td class="cell-date"><span class="date-relative"></span><span class="date-exact"></span></td>
+  <td class="cell-seen"><span class="seen-date"></span></td>
+</tr></template>
+
+<script id="discovery-data" type="text/plain">__DATA_PLACEHOLDER__</script>
+<script type="module">
 // ── Data ──────────────────────────────────────────────
-const RAW_DATA = __DATA_PLACEHOLDER__;
-
-// ── URL Normalization for dedup ───────────────────────
-function normalizeUrl(url) {
-  if (!url) return '';
-  try {
-    let u = url.trim();
-    // Remove protocol
-    u = u.replace(/^https?:\/\//, '');
-    // Remove www.
-    u = u.replace(/^www\./, '');
-    // Lowercase
-    u = u.toLowerCase();
-    // Strip trailing slash
-    u = u.replace(/\/+$/, '');
-    // Remove tracking params
-    const trackingParams = new Set([
-      'utm_source','utm_medium','utm_campaign','utm_term','utm_content',
-      'source','ref','src','trk','linksource','linkSource','LinkSource',
-      'gh_jid','gh_src'
-    ]);
-    if (u.includes('?')) {
-      const [path, qs] = u.split('?', 2);
-      const params = new URLSearchParams(qs);
-      const clean = [];
-      for (const [k, v] of params) {
-        if (!trackingParams.has(k) && !trackingParams.has(k.toLowerCase())) {
-          clean.push(k + '=' + v);
-        }
-      }
-      u = clean.length ? path + '?' + clean.join('&') : path;
-    }
-    return u;
-  } catch { return url.trim().toLowerCase(); }
-}
-
-// ── Compute first-seen map ────────────────────────────
-// Groups by normalized URL, finds earliest scraped_at for each
-const firstSeenMap = {};
-for (const d of RAW_DATA) {
-  const key = normalizeUrl(d.url);
-  if (!key) continue;
-  const ts = d.scraped_at || d.run_id || '';
-  if (!firstSeenMap[key] || ts < firstSeenMap[key]) {
-    firstSeenMap[key] = ts;
-  }
+// Column-oriented payload, {cols: [name, ...], rows: [[value, ...], ...]},
+// embedded as base64 gzip
+async function loadData() {
+  const b64 = document.getElementById('discovery-data').textContent;
+  const bin = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+  const json = new Blob([bin]).stream().pipeThrough(new DecompressionStream('gzip'));
+  return JSON.parse(await new Response(json).text());
 }
-const totalUniqueUrls = Object.keys(firstSeenMap).length;
+const RAW_DATA = await loadData();
 
 // ── State ─────────────────────────────────────────────
 let state = {
@@ -510,20 +764,44 @@ let state = {
   expandedIdx: null,
 };
 
+// ── DOM references ────────────────────────────────────
+// Looked up once; render and the handlers reuse them
+const byId = id => document.getElementById(id);
+const DOM = {
+  statsBar: byId('statsBar'),
+  activeChips: byId('activeChips'),
+  sidebar: byId('sidebar'),
+  sourceFilters: byId('sourceFilters'),
+  companyFilters: byId('companyFilters'),
+  deptFilters: byId('deptFilters'),
+  clearFilters: byId('clearFilters'),
+  resultCount: byId('resultCount'),
+  sortSelect: byId('sortSelect'),
+  perPageSelect: byId('perPageSelect'),
+  thead: document.querySelector('.jobs-table thead'),
+  sortArrows: Array.from(document.querySelectorAll('.jobs-table thead th'),
+    th => ({col: th.dataset.col, arrow: th.querySelector('.sort-arrow')})),
+  tableWrap: byId('tableWrap'),
+  tbody: byId('tableBody'),
+  detailPanel: byId('detailPanel'),
+  pagination: byId('pagination'),
+};
+
 // ── Precompute ────────────────────────────────────────
-const data = RAW_DATA.map((d, i) => {
-  const normUrl = normalizeUrl(d.url);
-  return {
-    ...d,
-    _idx: i,
-    _search: [d.title, d.company, d.location, d.source, d.department, d.description_snippet || ''].join('\x00').toLowerCase(),
-    _sourceBase: (d.source || '').split(':')[0],
-    _dept: d.department || '',
-    _normUrl: normUrl,
-    first_seen: firstSeenMap[normUrl] || d.scraped_at || '',
-  };
+// _normUrl, first_seen, _search, _sourceBase and _deptKey are computed
+// by the Python generator. _idx is each job's position in data, so
+// data[_idx] is the by-id lookup.
+const data = RAW_DATA.rows.map((row, i) => {
+  const d = {_idx: i};
+  const cols = RAW_DATA.cols;
+  for (let c = 0; c < cols.length; c++) d[cols[c]] = row[c];
+  return d;
 });
 
+const totalUniqueUrls = new Set(data.map(d => d._normUrl).filter(Boolean)).size;
+// Rows are deduplicated by URL unless generated with --no-dedup
+const totalLogEntries = data.reduce((n, d) => n + (d.seen_count || 1), 0);
+
 // ── Sidebar counts (dynamic based on current filter) ──
 function countBy(arr, key) {
   const m = {};
@@ -534,19 +812,34 @@ function countBy(arr, key) {
 // Full counts for sidebar ordering
 const allSourceCounts = countBy(data, '_sourceBase');
 const allCompanyCounts = countBy(data, 'company');
-const allDeptCounts = countBy(data, '_dept');
+const allDeptCounts = countBy(data, '_deptKey');
+
+// Sidebar order is fixed at boot, so per-render counts are a histogram
+// indexed by each value's position in that order
+const orderIndex = counts => new Map(counts.map(([v], i) => [v, i]));
+const sourceIdx = orderIndex(allSourceCounts);
+const companyIdx = orderIndex(allCompanyCounts);
+const deptIdx = orderIndex(allDeptCounts);
+
+function tally(arr, key, idx) {
+  const counts = new Int32Array(idx.size);
+  for (let i = 0; i < arr.length; i++) {
+    const j = idx.get(arr[i][key] || '(none)');
+    if (j !== undefined) counts[j]++;
+  }
+  return counts;
+}
 
 // ── Render sidebar filters with dynamic counts ────────
-function renderFilters(containerId, allCounts, filteredCounts, stateKey) {
-  const el = document.getElementById(containerId);
-  const filteredMap = Object.fromEntries(filteredCounts);
+function renderFilters(containerId, allCounts, counts, stateKey) {
+  const el = DOM[containerId];
   const limit = 15;
   const hasMore = allCounts.length > limit;
   let html = '';
 
   allCounts.forEach(([val], i) => {
-    const cnt = filteredMap[val] || 0;
-    const hidden = i >= limit ? ' style="display:none" data-overflow' : '';
+    const cnt = counts[i];
+    const hidden = i >= limit ? ' data-overflow' : '';
     const zeroClass = cnt === 0 ? ' zero-count' : '';
     const activeClass = state[stateKey] === val ? ' active' : '';
     html += `<div class="filter-group"${hidden}>
@@ -558,38 +851,144 @@ function renderFilters(containerId, allCounts, filteredCounts, stateKey) {
     html += `<button class="filter-btn show-more-btn" data-container="${containerId}">
       <span class="name">Show all ${allCounts.length}...</span></button>`;
   }
+  el.classList.remove('show-all');
   el.innerHTML = html;
 }
 
+// ── Search ────────────────────────────────────────────
+// Search box contents split into lowercased terms, once per distinct
+// query, plus one highlight regex matching any term (longest first, so a
+// term that contains another is marked whole)
+let _parsed = {search: null};
+function parseSearch(search) {
+  if (_parsed.search !== search) {
+    const all = search ? search.toLowerCase().split(/\s+/).filter(Boolean) : [];
+    const alts = [...all].sort((a, b) => b.length - a.length).map(escRegex);
+    _parsed = {
+      search, all,
+      highlightRe: alts.length ? new RegExp('(' + alts.join('|') + ')', 'gi') : null,
+    };
+  }
+  return _parsed;
+}
+
 // ── Get filtered data (without a specific filter key) ─
 function getFilteredExcluding(excludeKey) {
-  let arr = data;
-  if (state.search) {
-    const terms = state.search.toLowerCase().split(/\s+/).filter(Boolean);
-    arr = arr.filter(d => terms.every(t => d._search.includes(t)));
+  const terms = parseSearch(state.search).all;
+  const source = excludeKey !== 'sourceFilter' ? state.sourceFilter : null;
+  const company = excludeKey !== 'companyFilter' ? state.companyFilter : null;
+  const dept = excludeKey !== 'deptFilter' ? state.deptFilter : null;
+  // One pass with every predicate inline; cheapest checks first
+  const out = [];
+  rows: for (let i = 0; i < data.length; i++) {
+    const d = data[i];
+    if (source && d._sourceBase !== source) continue;
+    if (company && d.company !== company) continue;
+    if (dept && d._deptKey !== dept) continue;
+    for (let j = 0; j < terms.length; j++) {
+      if (d._search.indexOf(terms[j]) < 0) continue rows;
+    }
+    out.push(d);
   }
-  if (excludeKey !== 'sourceFilter' && state.sourceFilter)
-    arr = arr.filter(d => d._sourceBase === state.sourceFilter);
-  if (excludeKey !== 'companyFilter' && state.companyFilter)
-    arr = arr.filter(d => d.company === state.companyFilter);
-  if (excludeKey !== 'deptFilter' && state.deptFilter)
-    arr = arr.filter(d => (d._dept || '(none)') === state.deptFilter);
-  return arr;
+  return out;
 }
 
 // ── Filter / Sort / Search ────────────────────────────
+// Keyed on the state they depend on, so paging, expanding a row, keyboard
+// navigation and export reuse the last results instead of redoing the work
+let _filterCache = {key: null, arr: null};
+let _sortCache = {key: null, arr: null};
+let _facetCache = {key: null, counts: null};
+// ISO timestamps sort correctly as-is and need no lowercasing
+const ISO_COLS = new Set(['date_posted', 'first_seen', 'scraped_at']);
+
+function filterKey() {
+  return JSON.stringify([state.search, state.sourceFilter, state.companyFilter, state.deptFilter]);
+}
+
+// Filtered rows in data order
+function getUnsorted() {
+  const fKey = filterKey();
+  if (_filterCache.key !== fKey) {
+    _filterCache = {key: fKey, arr: getFilteredExcluding(null)};
+  }
+  return _filterCache.arr;
+}
+
+// Every row's index, ordered by one column and direction. Built once per
+// column over all of data (the data never changes) and reused for any
+// filter: the sorted filtered rows are this order restricted to them.
+// Ties keep data order in both directions, like a stable sort.
+const _columnOrders = new Map();  // 'col:dir' -> Int32Array of data indexes
+const _sortKeys = new Map();      // col -> each row's comparable key
+
+// ISO timestamps already sort as strings; text columns compare lowercased
+function sortKeys(col) {
+  let keys = _sortKeys.get(col);
+  if (!keys) {
+    keys = ISO_COLS.has(col)
+      ? data.map(d => d[col] || '')
+      : data.map(d => (d[col] || '').toLowerCase());
+    _sortKeys.set(col, keys);
+  }
+  return keys;
+}
+
+function columnOrder(col, dir) {
+  const cacheKey = col + ':' + dir;
+  let order = _columnOrders.get(cacheKey);
+  if (order) return order;
+  const keys = sortKeys(col);
+  const asc = _columnOrders.get(col + ':asc') ||
+    Int32Array.from(data.keys()).sort((i, j) => keys[i] < keys[j] ? -1 : keys[i] > keys[j] ? 1 : 0);
+  _columnOrders.set(col + ':asc', asc);
+  if (dir === 'asc') return asc;
+  // Descending: reverse the runs of equal keys, not the rows within them
+  order = new Int32Array(asc.length);
+  let out = 0;
+  for (let end = asc.length; end > 0;) {
+    let start = end - 1;
+    while (start > 0 && keys[asc[start - 1]] === keys[asc[end - 1]]) start--;
+    order.set(asc.subarray(start, end), out);
+    out += end - start;
+    end = start;
+  }
+  _columnOrders.set(cacheKey, order);
+  return order;
+}
+
 function getFiltered() {
-  let arr = getFilteredExcluding(null);
-  const col = state.sortCol;
-  const dir = state.sortDir === 'asc' ? 1 : -1;
-  arr = [...arr].sort((a, b) => {
-    let va = (a[col] || '').toLowerCase();
-    let vb = (b[col] || '').toLowerCase();
-    if (va < vb) return -1 * dir;
-    if (va > vb) return 1 * dir;
-    return 0;
-  });
-  return arr;
+  const arr = getUnsorted();
+  const sKey = JSON.stringify([_filterCache.key, state.sortCol, state.sortDir]);
+  if (_sortCache.key !== sKey) {
+    const order = columnOrder(state.sortCol, state.sortDir);
+    let sorted;
+    if (arr.length === data.length) {
+      sorted = Array.from(order, i => data[i]);
+    } else {
+      const keep = new Uint8Array(data.length);
+      for (const d of arr) keep[d._idx] = 1;
+      sorted = [];
+      for (const i of order) if (keep[i]) sorted.push(data[i]);
+    }
+    _sortCache = {key: sKey, arr: sorted};
+  }
+  return _sortCache.arr;
+}
+
+// Sidebar counts per facet, each ignoring that facet's own filter. When
+// a facet has no filter set, its rows are just the filtered rows.
+function facetCounts() {
+  const key = filterKey();
+  if (_facetCache.key !== key) {
+    const rows = k => state[k] ? getFilteredExcluding(k) : getUnsorted();
+    _facetCache = {key, counts: {
+      source: tally(rows('sourceFilter'), '_sourceBase', sourceIdx),
+      company: tally(rows('companyFilter'), 'company', companyIdx),
+      dept: tally(rows('deptFilter'), '_deptKey', deptIdx),
+    }};
+  }
+  return _facetCache.counts;
 }
 
 // ── Render stats ──────────────────────────────────────
@@ -598,10 +997,10 @@ function renderStats(filtered) {
   const sources = new Set(filtered.map(d => d._sourceBase)).size;
   const uniqueUrls = new Set(filtered.map(d => d._normUrl).filter(Boolean)).size;
 
-  document.getElementById('statsBar').innerHTML = `
+  DOM.statsBar.innerHTML = `
     <div class="stat-card"><div class="label">Showing</div>
       <div class="value">${filtered.length.toLocaleString()}</div>
-      <div class="sub">of ${data.length.toLocaleString()} log entries</div></div>
+      <div class="sub">of ${data.length.toLocaleString()} rows (${totalLogEntries.toLocaleString()} log entries)</div></div>
     <div class="stat-card"><div class="label">Unique Jobs</div>
       <div class="value">${uniqueUrls.toLocaleString()}</div>
       <div class="sub">by URL (${totalUniqueUrls.toLocaleString()} total)</div></div>
@@ -616,7 +1015,7 @@ function renderStats(filtered) {
 
 // ── Active chips ──────────────────────────────────────
 function renderChips() {
-  const el = document.getElementById('activeChips');
+  const el = DOM.activeChips;
   let html = '';
   if (state.search) html += `<div class="chip">Search: "${esc(state.search)}" <span class="chip-x" data-clear="search">&times;</span></div>`;
   if (state.sourceFilter) html += `<div class="chip">Source: ${esc(state.sourceFilter)} <span class="chip-x" data-clear="sourceFilter">&times;</span></div>`;
@@ -626,59 +1025,83 @@ function renderChips() {
 }
 
 // ── Badge helper ──────────────────────────────────────
-function badgeClass(source) { return 'badge badge-' + (source || '').split(':')[0]; }
+function badgeClass(sourceBase) { return 'badge badge-' + sourceBase; }
 
 // ── Highlight helper ──────────────────────────────────
-function highlight(text, search) {
-  if (!search || !text) return esc(text || '');
-  const terms = search.toLowerCase().split(/\s+/).filter(Boolean);
-  let result = esc(text);
-  for (const term of terms) {
-    const re = new RegExp('(' + escRegex(term) + ')', 'gi');
-    result = result.replace(re, '<mark>$1</mark>');
-  }
-  return result;
+// Wraps search terms in <mark>; html must already be escaped
+function markTerms(html, search) {
+  if (!search || !html) return html;
+  const re = parseSearch(search).highlightRe;
+  return re ? html.replace(re, '<mark>$1</mark>') : html;
 }
 function esc(s) { if(!s) return ''; return String(s).replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;'); }
 function escRegex(s) { return s.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'); }
 
 // ── Date formatting ───────────────────────────────────
+// Formatters are built once, and results memoized per raw date string;
+// relative dates depend on the clock, so that cache is dropped each minute.
+// Results are plain text; callers building markup escape them.
+const DATE_FMT = new Intl.DateTimeFormat('en-US', { month:'short', day:'numeric', year:'numeric' });
+const DATETIME_FMT = new Intl.DateTimeFormat('en-US', { month:'short', day:'numeric', year:'numeric', hour:'numeric', minute:'2-digit' });
+const _fmtDateCache = new Map();
+const _fmtDateTimeCache = new Map();
+const _relativeCache = new Map();
+let _relativeMinute = 0;
+
+function memoized(cache, d, compute) {
+  let v = cache.get(d);
+  if (v === undefined) { v = compute(d); cache.set(d, v); }
+  return v;
+}
+// Relative dates, and anything built from them, are good for one minute
+function clockMinute() { return Math.floor(Date.now() / 60000); }
 function relativeDate(d) {
   if (!d) return '';
-  try {
-    const dt = new Date(d);
-    if (isNaN(dt)) return esc(d);
-    const now = new Date();
-    const diffMs = now - dt;
-    const diffDays = Math.floor(diffMs / 86400000);
-    if (diffDays < 0) return fmtDate(d);
-    if (diffDays === 0) return 'Today';
-    if (diffDays === 1) return 'Yesterday';
-    if (diffDays < 7) return diffDays + 'd ago';
-    if (diffDays < 30) return Math.floor(diffDays/7) + 'w ago';
-    if (diffDays < 365) return Math.floor(diffDays/30) + 'mo ago';
-    return Math.floor(diffDays/365) + 'y ago';
-  } catch { return esc(d); }
+  const minute = clockMinute();
+  if (minute !== _relativeMinute) { _relativeCache.clear(); _relativeMinute = minute; }
+  return memoized(_relativeCache, d, computeRelativeDate);
+}
+function computeRelativeDate(d) {
+  const dt = new Date(d);
+  if (isNaN(dt)) return String(d);
+  const now = new Date();
+  const diffMs = now - dt;
+  const diffDays = Math.floor(diffMs / 86400000);
+  if (diffDays < 0) return fmtDate(d);
+  if (diffDays === 0) return 'Today';
+  if (diffDays === 1) return 'Yesterday';
+  if (diffDays < 7) return diffDays + 'd ago';
+  if (diffDays < 30) return Math.floor(diffDays/7) + 'w ago';
+  if (diffDays < 365) return Math.floor(diffDays/30) + 'mo ago';
+  return Math.floor(diffDays/365) + 'y ago';
 }
 function fmtDate(d) {
   if (!d) return '';
-  try {
-    const dt = new Date(d);
-    if (isNaN(dt)) return esc(d);
-    return dt.toLocaleDateString('en-US', { month:'short', day:'numeric', year:'numeric' });
-  } catch { return esc(d); }
+  return memoized(_fmtDateCache, d, formatDate);
 }
 function fmtDateTime(d) {
   if (!d) return '';
-  try {
+  return memoized(_fmtDateTimeCache, d, formatDateTime);
+}
+function formatWith(fmt) {
+  return d => {
     const dt = new Date(d);
-    if (isNaN(dt)) return esc(d);
-    return dt.toLocaleDateString('en-US', { month:'short', day:'numeric', year:'numeric', hour:'numeric', minute:'2-digit' });
-  } catch { return esc(d); }
+    return isNaN(dt) ? String(d) : fmt.format(dt);
+  };
 }
+const formatDate = formatWith(DATE_FMT);
+const formatDateTime = formatWith(DATETIME_FMT);
 
 // ── Render table ──────────────────────────────────────
-function render() {
+// Parts of the page a state change can touch. Handlers pass the parts
+// their change affects; paging and sorting leave the filtered set, and so
+// the stats, chips and sidebar, as they were.
+const ROWS = 1, PAGE = 2, FACETS = 4, ARROWS = 8;
+const ALL = ROWS | PAGE | FACETS | ARROWS;
+
+function render(dirty = ALL) {
+  // Read phase: layout and data first, then every DOM write below
+  const viewport = readViewport();
   const filtered = getFiltered();
   const total = filtered.length;
   const pages = Math.max(1, Math.ceil(total / state.perPage));
@@ -686,101 +1109,266 @@ function render() {
   const start = (state.page - 1) * state.perPage;
   const pageData = filtered.slice(start, start + state.perPage);
 
-  renderStats(filtered);
-  renderChips();
+  if (dirty & FACETS) {
+    renderStats(filtered);
+    renderChips();
 
-  // Dynamic sidebar counts
-  const srcData = getFilteredExcluding('sourceFilter');
-  const coData = getFilteredExcluding('companyFilter');
-  const deptData = getFilteredExcluding('deptFilter');
-  renderFilters('sourceFilters', allSourceCounts, countBy(srcData, '_sourceBase'), 'sourceFilter');
-  renderFilters('companyFilters', allCompanyCounts, countBy(coData, 'company'), 'companyFilter');
-  renderFilters('deptFilters', allDeptCounts, countBy(deptData, '_dept'), 'deptFilter');
+    // Dynamic sidebar counts
+    const counts = facetCounts();
+    renderFilters('sourceFilters', allSourceCounts, counts.source, 'sourceFilter');
+    renderFilters('companyFilters', allCompanyCounts, counts.company, 'companyFilter');
+    renderFilters('deptFilters', allDeptCounts, counts.dept, 'deptFilter');
 
-  document.getElementById('clearFilters').style.display =
-    (state.sourceFilter || state.companyFilter || state.deptFilter) ? '' : 'none';
+    DOM.clearFilters.style.display =
+      (state.sourceFilter || state.companyFilter || state.deptFilter) ? '' : 'none';
 
-  // Result count
-  const rcEl = document.getElementById('resultCount');
-  if (state.search || state.sourceFilter || state.companyFilter || state.deptFilter) {
-    rcEl.innerHTML = `<strong>${total.toLocaleString()}</strong> results`;
-  } else {
-    rcEl.innerHTML = `<strong>${total.toLocaleString()}</strong> log entries`;
+    // Result count
+    const rcEl = DOM.resultCount;
+    if (state.search || state.sourceFilter || state.companyFilter || state.deptFilter) {
+      rcEl.innerHTML = `<strong>${total.toLocaleString()}</strong> results`;
+    } else {
+      rcEl.innerHTML = `<strong>${total.toLocaleString()}</strong> ${total === totalLogEntries ? 'log entries' : 'jobs'}`;
+    }
   }
 
   // Table body
-  const tbody = document.getElementById('tableBody');
-  let html = '';
+  if (dirty & ROWS) {
+    pageRows = pageData;
+    lastWindowKey = null;
+    renderRows(viewport);
+  }
+
+  if (dirty & PAGE) renderPagination(pages, total);
+
+  // Sort arrows
+  if (dirty & ARROWS) {
+    DOM.sortArrows.forEach(({col, arrow}) => {
+      if (col === state.sortCol) {
+        arrow.textContent = state.sortDir === 'asc' ? ' \u25B2' : ' \u25BC';
+      } else {
+        arrow.textContent = '';
+      }
+    });
+  }
+}
+
+// ── DOM helpers ───────────────────────────────────────
+// Parses markup once into a fragment and swaps it in, rather than having
+// innerHTML tear down and reparse the container in place
+const _range = document.createRange();
+function setHTML(el, html) {
+  _range.selectNodeContents(el);
+  el.replaceChildren(_range.createContextualFragment(html));
+}
+
+// ── Virtualized rows ──────────────────────────────────
+// Rows have a fixed CSS height, so the body renders only the rows in view
+// (plus overscan) between two spacer rows sized to stand in for the rest.
+const OVERSCAN = 10;
+let rowHeight = 77;      // cell height + border; measured after first render
+let rowHeightMeasured = false;
+let detailHeight = 0;    // height of the open detail row, once measured
+let detailMeasuredIdx = null;
+
+// Layout reads happen here, before render writes anything, so the
+// browser never has to lay out mid-render to answer them
+function readViewport() {
+  return {scrollTop: DOM.tableWrap.scrollTop, height: DOM.tableWrap.clientHeight};
+}
+
+// Position of the expanded job within the page, or -1. Scrolling asks on
+// every frame, so it is looked up again only when the page or the
+// expanded job changes.
+let _openPos = {rows: null, idx: null, pos: -1};
+function openPosition(pageData) {
+  if (_openPos.rows !== pageData || _openPos.idx !== state.expandedIdx) {
+    const idx = state.expandedIdx;
+    _openPos = {rows: pageData, idx, pos: idx === null ? -1 : pageData.findIndex(j => j._idx === idx)};
+  }
+  return _openPos.pos;
+}
+
+function visibleWindow(pageData, viewport) {
+  const n = pageData.length;
+  const open = openPosition(pageData);
+  // Map scrollTop to a row index, skipping over the open detail row
+  const scroll = viewport.scrollTop;
+  const openEnd = (open + 1) * rowHeight;
+  let first;
+  if (open < 0 || scroll < openEnd) first = Math.floor(scroll / rowHeight);
+  else if (scroll < openEnd + detailHeight) first = open;
+  else first = open + 1 + Math.floor((scroll - openEnd - detailHeight) / rowHeight);
+  first = Math.min(first, Math.max(0, n - 1));
+  const start = Math.max(0, first - OVERSCAN);
+  const end = Math.min(n, first + Math.ceil(viewport.height / rowHeight) + OVERSCAN);
+  return {
+    start, end,
+    top: start * rowHeight + (open >= 0 && open < start ? detailHeight : 0),
+    bottom: (n - end) * rowHeight + (open >= end ? detailHeight : 0),
+  };
+}
+
+// Reading offsetHeight right after a write forces layout, so each height
+// is measured only when it can have changed: the row height once, the
+// detail height when a different row is opened. While the panel's opening
+// animation runs its height is still growing, so it is measured on
+// animationend instead.
+function measureRows(tbody) {
+  if (!rowHeightMeasured) {
+    const row = tbody.querySelector('tr.job-row');
+    if (row && row.offsetHeight) { rowHeight = row.offsetHeight; rowHeightMeasured = true; }
+  }
+  if (state.expandedIdx !== null && state.expandedIdx !== detailMeasuredIdx &&
+      !detailPanel.classList.contains('opening')) {
+    const detail = tbody.querySelector('tr.detail-row');
+    if (detail) { detailHeight = detail.offsetHeight; detailMeasuredIdx = state.expandedIdx; }
+  }
+}
+
+// One job row, cloned from the #rowTpl skeleton. Plain fields are set
+// through textContent; only highlighted fields go through the HTML parser.
+// Without a search, collapsed rows don't change between renders, so each
+// job's row element is built once and reused. The rows show relative
+// dates, so the cache is dropped when those roll over to a new minute,
+// and it is capped at ROW_CACHE_MAX rows.
+const rowTpl = document.getElementById('rowTpl').content.firstElementChild;
+const ROW_CACHE_MAX = 1000;
+const rowCache = new Map();  // _idx -> collapsed row element
+let rowCacheMinute = 0;
+
+function rowNode(job, expanded) {
+  if (state.search || expanded) return buildRow(job, expanded);
+  const minute = clockMinute();
+  if (minute !== rowCacheMinute || rowCache.size >= ROW_CACHE_MAX) {
+    rowCache.clear();
+    rowCacheMinute = minute;
+  }
+  let row = rowCache.get(job._idx);
+  if (!row) { row = buildRow(job, false); rowCache.set(job._idx, row); }
+  return row;
+}
+
+function buildRow(job, expanded) {
+  const tr = rowTpl.cloneNode(true);
+  const search = state.search;
+  tr.dataset.idx = job._idx;
+  if (expanded) tr.classList.add('expanded');
+  tr.querySelector('.expand-hint').textContent = expanded ? '\u25BC' : '\u25B6';
+  fillText(tr.querySelector('.title-text'), job.title, job._escTitle, search);
+  const descPreview = (job.description_snippet || '').replace(/<[^>]*>/g, '').substring(0, 120);
+  const desc = tr.querySelector('.desc-preview');
+  if (!descPreview) desc.remove();
+  else fillText(desc, descPreview, esc(descPreview), search);
+  fillText(tr.querySelector('.cell-company'), job.company, job._escCompany, search);
+  fillText(tr.querySelector('.cell-location'), job.location, job._escLocation, search);
+  const badge = tr.querySelector('.badge');
+  badge.className = badgeClass(job._sourceBase);
+  badge.textContent = job.source || '';
+  if (job.date_posted) {
+    tr.querySelector('.date-relative').textContent = relativeDate(job.date_posted);
+    tr.querySelector('.date-exact').textContent = fmtDate(job.date_posted);
+  } else {
+    tr.querySelector('.cell-date').replaceChildren();
+  }
+  const seen = tr.querySelector('.seen-date');
+  seen.title = job.first_seen || '';
+  seen.textContent = relativeDate(job.first_seen);
+  return tr;
+}
+
+function fillText(el, text, escaped, search) {
+  if (search) el.innerHTML = markTerms(escaped, search);
+  else el.textContent = text || '';
+}
+
+// A row with one cell spanning the table, for spacers and the detail slot
+function fullWidthRow(className, height, content) {
+  const tr = document.createElement('tr');
+  const td = document.createElement('td');
+  tr.className = className;
+  td.colSpan = 6;
+  if (height) td.style.height = height + 'px';
+  if (content) td.appendChild(content);
+  tr.appendChild(td);
+  return tr;
+}
+
+// ── Render table rows ─────────────────────────────────
+// Builds only the rows in or near the viewport. Scrolling calls this
+// directly, skipping the stats/sidebar work of a full render, and it is
+// a no-op while the visible window hasn't changed.
+let pageRows = [];
+let lastWindowKey = null;
+
+function renderRows(viewport = readViewport()) {
+  const pageData = pageRows;
+  const win = visibleWindow(pageData, viewport);
+  const winKey = `${state.expandedIdx}:${win.start}:${win.end}:${win.top}:${win.bottom}`;
+  if (winKey === lastWindowKey) return;
+  lastWindowKey = winKey;
+  const tbody = DOM.tbody;
   if (pageData.length === 0) {
-    html = `<tr><td colspan="6"><div class="empty-state">
-      <p style="font-size:32px;margin-bottom:8px">No results</p>
-      <p>Try adjusting your search or filters</p></div></td></tr>`;
+    setHTML(tbody, `<tr><td colspan="6"><div class="empty-state">
+      <p class="empty-title">No results</p>
+      <p>Try adjusting your search or filters</p></div></td></tr>`);
+    detailPanel.hidden = true;
+    return;
   }
-  for (const job of pageData) {
+  const frag = document.createDocumentFragment();
+  let detailShown = false;
+  if (win.top) frag.appendChild(fullWidthRow('spacer-row', win.top));
+  for (const job of pageData.slice(win.start, win.end)) {
     const expanded = state.expandedIdx === job._idx;
-    const descPreview = (job.description_snippet || '').replace(/<[^>]*>/g, '').substring(0, 120);
-    html += `<tr data-idx="${job._idx}" class="job-row${expanded?' expanded':''}">
-      <td><div class="cell cell-title">
-        <span class="expand-hint">${expanded?'&#9660;':'&#9654;'}</span>
-        <div class="title-text">${highlight(job.title, state.search)}</div>
-        ${descPreview ? `<div class="desc-preview">${highlight(descPreview, state.search)}</div>` : ''}
-      </div></td>
-      <td><div class="cell cell-company">${highlight(job.company, state.search)}</div></td>
-      <td><div class="cell cell-location">${highlight(job.location, state.search) || ''}</div></td>
-      <td><div class="cell"><span class="${badgeClass(job.source)}">${esc(job.source)}</span></div></td>
-      <td><div class="cell cell-date">${job.date_posted ?
-          `<span class="date-relative">${relativeDate(job.date_posted)}</span><span class="date-exact">${fmtDate(job.date_posted)}</span>` : ''}</div></td>
-      <td><div class="cell cell-seen">
-        <span class="seen-date" title="${esc(job.first_seen)}">${relativeDate(job.first_seen)}</span>
-      </div></td>
-    </tr>`;
+    frag.appendChild(rowNode(job, expanded));
     if (expanded) {
-      html += `<tr class="detail-row"><td colspan="6">
-        <div class="detail-panel">
-          <div class="detail-grid">
-            <div class="detail-field"><label>Title</label><div class="val">${esc(job.title)}</div></div>
-            <div class="detail-field"><label>Company</label><div class="val">${esc(job.company)}</div></div>
-            <div class="detail-field"><label>Location</label><div class="val">${esc(job.location) || '<span style="color:var(--text-muted)">Not specified</span>'}</div></div>
-            <div class="detail-field"><label>Source</label><div class="val"><span class="${badgeClass(job.source)}">${esc(job.source)}</span></div></div>
-            <div class="detail-field"><label>Department</label><div class="val">${esc(job.department) || '<span style="color:var(--text-muted)">Not specified</span>'}</div></div>
-            <div class="detail-field"><label>Date Posted</label><div class="val">${fmtDate(job.date_posted) || '<span style="color:var(--text-muted)">Unknown</span>'}</div></div>
-            <div class="detail-field"><label>First Seen</label><div class="val">${fmtDateTime(job.first_seen)}</div></div>
-            <div class="detail-field"><label>Scraped At</label><div class="val" style="font-size:11px;color:var(--text-dim)">${fmtDateTime(job.scraped_at)}</div></div>
-          </div>
-          <div class="url-row">
-            <label style="font-size:9px;text-transform:uppercase;color:var(--text-muted);letter-spacing:0.8px;font-weight:500;flex-shrink:0">URL</label>
-            <a href="${esc(job.url)}" target="_blank" rel="noopener">${esc(job.url)}</a>
-            <button class="copy-btn" data-url="${esc(job.url)}">Copy</button>
-          </div>
-          ${(job.description_snippet) ? `<div class="detail-field">
-            <label>Description</label>
-            <div class="description-box">${esc(job.description_snippet)}</div>
-          </div>` : ''}
-        </div>
-      </td></tr>`;
+      fillDetailPanel(job);
+      frag.appendChild(fullWidthRow('detail-row', 0, detailPanel));
+      detailShown = true;
     }
   }
-  tbody.innerHTML = html;
-
-  // Pagination
-  renderPagination(pages, total);
+  if (win.bottom) frag.appendChild(fullWidthRow('spacer-row', win.bottom));
+  tbody.replaceChildren(frag);
+  detailPanel.hidden = !detailShown;
+  measureRows(tbody);
+}
 
-  // Sort arrows
-  document.querySelectorAll('.jobs-table thead th').forEach(th => {
-    const col = th.dataset.col;
-    const arrow = th.querySelector('.sort-arrow');
-    if (col === state.sortCol) {
-      arrow.textContent = state.sortDir === 'asc' ? ' \u25B2' : ' \u25BC';
-    } else {
-      arrow.textContent = '';
-    }
-  });
+// ── Detail panel ──────────────────────────────────────
+// One panel element, filled when a different job is expanded and moved
+// into the expanded row's detail slot on each row render, so re-renders
+// for sort/search/page never rebuild it
+const detailPanel = DOM.detailPanel;
+let detailPanelIdx = null;
+
+function fillDetailPanel(job) {
+  if (detailPanelIdx === job._idx) return;
+  detailPanelIdx = job._idx;
+  setHTML(detailPanel, `
+    <div class="detail-grid">
+      <div class="detail-field"><label>Title</label><div class="val">${job._escTitle}</div></div>
+      <div class="detail-field"><label>Company</label><div class="val">${job._escCompany}</div></div>
+      <div class="detail-field"><label>Location</label><div class="val">${job._escLocation || '<span class="empty">Not specified</span>'}</div></div>
+      <div class="detail-field"><label>Source</label><div class="val"><span class="${badgeClass(job._sourceBase)}">${job._escSource}</span></div></div>
+      <div class="detail-field"><label>Department</label><div class="val">${esc(job.department) || '<span class="empty">Not specified</span>'}</div></div>
+      <div class="detail-field"><label>Date Posted</label><div class="val">${esc(fmtDate(job.date_posted)) || '<span class="empty">Unknown</span>'}</div></div>
+      <div class="detail-field"><label>First Seen</label><div class="val">${esc(fmtDateTime(job.first_seen))}</div></div>
+      <div class="detail-field"><label>Scraped At</label><div class="val scraped-at">${esc(fmtDateTime(job.scraped_at))}</div></div>
+      ${job.seen_count ? `<div class="detail-field"><label>Times Seen</label><div class="val">${job.seen_count.toLocaleString()}</div></div>` : ''}
+    </div>
+    <div class="url-row">
+      <label class="url-label">URL</label>
+      <a href="${esc(job.url)}" target="_blank" rel="noopener">${esc(job.url)}</a>
+      <button class="copy-btn">Copy</button>
+    </div>
+    ${(job.description_snippet) ? `<div class="detail-field">
+      <label>Description</label>
+      <div class="description-box">${esc(job.description_snippet)}</div>
+    </div>` : ''}`);
 }
 
 // ── Pagination rendering ──────────────────────────────
 function renderPagination(pages, total) {
-  const el = document.getElementById('pagination');
-  if (pages <= 1) { el.innerHTML = ''; return; }
+  const el = DOM.pagination;
+  if (pages <= 1) { el.replaceChildren(); return; }
   let html = `<button id="prevPage" ${state.page<=1?'disabled':''}>&#8592;</button>`;
   const show = new Set([1, pages]);
   for (let i = Math.max(1,state.page-2); i <= Math.min(pages,state.page+2); i++) show.add(i);
@@ -793,7 +1381,7 @@ function renderPagination(pages, total) {
   }
   html += `<button id="nextPage" ${state.page>=pages?'disabled':''}>&#8594;</button>`;
   html += `<span class="page-info">${((state.page-1)*state.perPage+1).toLocaleString()}\u2013${Math.min(state.page*state.perPage,total).toLocaleString()} of ${total.toLocaleString()}</span>`;
-  el.innerHTML = html;
+  setHTML(el, html);
 }
 
 // ── Toast ─────────────────────────────────────────────
@@ -804,87 +1392,120 @@ function showToast(msg) {
   setTimeout(() => t.remove(), 1800);
 }
 
+// ── Render scheduling ─────────────────────────────────
+// Coalesces bursts of state changes into one render per frame, covering
+// every part any of them marked dirty
+let _rafPending = false;
+let _dirty = 0;
+function scheduleRender(dirty = ALL) {
+  _dirty |= dirty;
+  if (_rafPending) return;
+  _rafPending = true;
+  requestAnimationFrame(() => {
+    const parts = _dirty;
+    _rafPending = false; _dirty = 0;
+    render(parts);
+  });
+}
+
+// Row-only variant for scrolling and expanding, which change nothing else
+let _rowsPending = false;
+function scheduleRows() {
+  if (_rowsPending) return;
+  _rowsPending = true;
+  requestAnimationFrame(() => { _rowsPending = false; renderRows(); });
+}
+
 // ── Event listeners ───────────────────────────────────
 const searchInput = document.getElementById('searchInput');
 const clearBtn = document.getElementById('clearSearch');
+// Debounced, then deferred until the main thread is idle (at most 200ms)
+// so a search never competes with keystrokes; Safari lacks
+// requestIdleCallback and falls back to a zero timeout
+const whenIdle = window.requestIdleCallback
+  ? fn => requestIdleCallback(fn, {timeout: 200})
+  : fn => setTimeout(fn, 0);
 let searchTimeout;
 searchInput.addEventListener('input', () => {
   clearTimeout(searchTimeout);
   clearBtn.classList.toggle('show', searchInput.value.length > 0);
-  searchTimeout = setTimeout(() => {
+  searchTimeout = setTimeout(() => whenIdle(() => {
+    if (state.search === searchInput.value) return;
     state.search = searchInput.value;
     state.page = 1; state.expandedIdx = null;
-    render();
-  }, 120);
+    scheduleRender(ROWS | PAGE | FACETS);
+  }), 80);
 });
 clearBtn.addEventListener('click', () => {
   searchInput.value = ''; clearBtn.classList.remove('show');
   state.search = ''; state.page = 1;
-  render(); searchInput.focus();
+  scheduleRender(ROWS | PAGE | FACETS); searchInput.focus();
 });
 
 // Sidebar filters
-document.getElementById('sidebar').addEventListener('click', e => {
+// One delegated listener covers the filter buttons, "show more" and
+// "clear all" buttons inside the sidebar
+DOM.sidebar.addEventListener('click', e => {
+  if (e.target.closest('.clear-filters')) {
+    state.sourceFilter = null; state.companyFilter = null; state.deptFilter = null;
+    state.page = 1; state.expandedIdx = null; scheduleRender(ROWS | PAGE | FACETS); return;
+  }
   const btn = e.target.closest('.filter-btn[data-key]');
   if (btn) {
     const key = btn.dataset.key, val = btn.dataset.val;
     state[key] = state[key] === val ? null : val;
     state.page = 1; state.expandedIdx = null;
-    render(); return;
+    scheduleRender(ROWS | PAGE | FACETS); return;
   }
   const showMore = e.target.closest('.show-more-btn');
   if (showMore) {
-    const container = document.getElementById(showMore.dataset.container);
-    container.querySelectorAll('[data-overflow]').forEach(el => el.style.display = '');
+    const container = DOM[showMore.dataset.container];
+    container.classList.add('show-all');
     showMore.style.display = 'none';
   }
 });
 
-document.getElementById('clearFilters').addEventListener('click', () => {
-  state.sourceFilter = null; state.companyFilter = null; state.deptFilter = null;
-  state.page = 1; state.expandedIdx = null; render();
-});
-
 // Active chips removal
-document.getElementById('activeChips').addEventListener('click', e => {
+DOM.activeChips.addEventListener('click', e => {
   const x = e.target.closest('.chip-x');
   if (!x) return;
   const key = x.dataset.clear;
   if (key === 'search') { searchInput.value = ''; clearBtn.classList.remove('show'); state.search = ''; }
   else { state[key] = null; }
-  state.page = 1; state.expandedIdx = null; render();
+  state.page = 1; state.expandedIdx = null; scheduleRender(ROWS | PAGE | FACETS);
 });
 
 // Sort select
-document.getElementById('sortSelect').addEventListener('change', e => {
+DOM.sortSelect.addEventListener('change', e => {
   const [col, dir] = e.target.value.split('-');
   state.sortCol = col; state.sortDir = dir;
-  state.page = 1; state.expandedIdx = null; render();
+  state.page = 1; state.expandedIdx = null; scheduleRender(ROWS | PAGE | ARROWS);
 });
 
 // Column header sort
-document.querySelector('.jobs-table thead').addEventListener('click', e => {
+DOM.thead.addEventListener('click', e => {
   const th = e.target.closest('th[data-col]');
   if (!th) return;
   const col = th.dataset.col;
   if (state.sortCol === col) { state.sortDir = state.sortDir === 'asc' ? 'desc' : 'asc'; }
   else { state.sortCol = col; state.sortDir = 'asc'; }
   const opt = document.querySelector(`#sortSelect option[value="${col}-${state.sortDir}"]`);
-  if (opt) document.getElementById('sortSelect').value = opt.value;
-  state.page = 1; render();
+  if (opt) DOM.sortSelect.value = opt.value;
+  state.page = 1; scheduleRender(ROWS | PAGE | ARROWS);
 });
 
 // Per page
-document.getElementById('perPageSelect').addEventListener('change', e => {
-  state.perPage = parseInt(e.target.value); state.page = 1; render();
+DOM.perPageSelect.addEventListener('change', e => {
+  state.perPage = parseInt(e.target.value); state.page = 1; scheduleRender(ROWS | PAGE);
 });
 
 // Row expand + copy URL
-document.getElementById('tableBody').addEventListener('click', e => {
+DOM.tbody.addEventListener('click', e => {
   // Copy button
   const copyBtn = e.target.closest('.copy-btn');
   if (copyBtn) {
-    navigator.clipboard.writeText(copyBtn.dataset.url).then(() => {
+    // The only copy button is in the detail panel, which shows detailPanelIdx
+    navigator.clipboard.writeText(data[detailPanelIdx].url).then(() => {
       copyBtn.textContent = 'Copied!'; copyBtn.classList.add('copied');
       setTimeout(() => { copyBtn.textContent = 'Copy'; copyBtn.classList.remove('copied'); }, 1500);
     });
@@ -896,20 +1517,32 @@ document.getElementById('tableBody').addEventListener('click', e => {
   if (!row) return;
   const idx = parseInt(row.dataset.idx);
   state.expandedIdx = state.expandedIdx === idx ? null : idx;
-  render();
+  if (state.expandedIdx !== null) detailPanel.classList.add('opening');
+  scheduleRows();
+});
+
+// Once the opening animation ends the panel has its final height; measure
+// it and re-window, since the spacers and scroll mapping depend on it
+detailPanel.addEventListener('animationend', () => {
+  detailPanel.classList.remove('opening');
+  detailMeasuredIdx = null;
+  measureRows(DOM.tbody);
+  scheduleRows();
 });
 
 // Pagination clicks
-document.getElementById('pagination').addEventListener('click', e => {
+DOM.pagination.addEventListener('click', e => {
   const btn = e.target.closest('button');
   if (!btn || btn.disabled) return;
   if (btn.id === 'prevPage') state.page--;
   else if (btn.id === 'nextPage') state.page++;
   else if (btn.dataset.page) state.page = parseInt(btn.dataset.page);
-  state.expandedIdx = null; render();
-  document.getElementById('tableWrap').scrollTop = 0;
+  state.expandedIdx = null; scheduleRender(ROWS | PAGE);
+  DOM.tableWrap.scrollTop = 0;
 });
 
+DOM.tableWrap.addEventListener('scroll', scheduleRows, {passive: true});
+
 // Keyboard
 document.addEventListener('keydown', e => {
   if (e.key === '/' && document.activeElement !== searchInput) {
@@ -918,27 +1551,37 @@ document.addEventListener('keydown', e => {
   if (e.key === 'Escape') {
     if (state.search) {
       searchInput.value = ''; clearBtn.classList.remove('show');
-      state.search = ''; state.page = 1; render();
+      state.search = ''; state.page = 1; scheduleRender(ROWS | PAGE | FACETS);
     }
     searchInput.blur();
   }
   if (document.activeElement === searchInput) return;
-  if (e.key === 'ArrowLeft' && state.page > 1) { state.page--; state.expandedIdx = null; render(); }
+  if (e.key === 'ArrowLeft' && state.page > 1) { state.page--; state.expandedIdx = null; scheduleRender(ROWS | PAGE); }
   if (e.key === 'ArrowRight') {
     const pages = Math.ceil(getFiltered().length / state.perPage);
-    if (state.page < pages) { state.page++; state.expandedIdx = null; render(); }
+    if (state.page < pages) { state.page++; state.expandedIdx = null; scheduleRender(ROWS | PAGE); }
   }
 });
 
 // CSV export
+// Quotes any value, numbers and null included; the replace only runs for
+// the rare value that contains a quote
+const CSV_QUOTE = /"/g;
+function csvCell(v) {
+  if (v == null) return '""';
+  const s = typeof v === 'string' ? v : String(v);
+  return '"' + (s.indexOf('"') === -1 ? s : s.replace(CSV_QUOTE, '""')) + '"';
+}
+
 document.getElementById('exportBtn').addEventListener('click', () => {
   const filtered = getFiltered();
   const cols = ['title','company','url','location','department','source','date_posted','first_seen','description_snippet'];
-  let csv = cols.join(',') + '\n';
+  // One part per row; Blob joins them without building one large string
+  const parts = [cols.join(',') + '\n'];
   for (const job of filtered) {
-    csv += cols.map(c => '"' + (job[c]||'').replace(/"/g,'""') + '"').join(',') + '\n';
+    parts.push(cols.map(c => csvCell(job[c])).join(',') + '\n');
   }
-  const blob = new Blob([csv], {type:'text/csv'});
+  const blob = new Blob(parts, {type:'text/csv'});
   const url = URL.createObjectURL(blob);
   const a = document.createElement('a');
   a.href = url; a.download = 'discovery_jobs_export.csv';
@@ -952,6 +1595,9 @@ render();
 </body>
 </html>"""
 
+# Split once at import: literal chunks interleaved with placeholder tokens
+_TEMPLATE_PARTS = re.split(r"(__DATA_PLACEHOLDER__|__GENERATED_AT__)", HTML_TEMPLATE)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Generate Discovery Log Viewer HTML")
@@ -972,6 +1618,11 @@ def main():
         action="store_true",
         help="Auto-open the generated HTML in the default browser",
     )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Embed every log entry instead of one row per unique job URL",
+    )
     args = parser.parse_args()
 
     input_path = Path(args.input)
@@ -984,14 +1635,14 @@ def main():
     print(f"Reading {input_path}...")
     entries = load_jsonl(input_path)
     print(f"  Loaded {len(entries)} log entries")
+    if not args.no_dedup:
+        entries = _dedup_by_url(entries)
+        print(f"  Kept {len(entries)} unique jobs")
 
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
-    html = generate_html(entries, generated_at)
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(html)
-    print(f"  Wrote {output_path} ({len(html)//1024} KB)")
+    size = write_html(entries, generated_at, output_path)
+    print(f"  Wrote {output_path} ({size//1024} KB)")
 
     if args.open:
         url = f"file://{output_path.resolve()}"